@@ -62,12 +62,42 @@ __license__ = "MIT"
 # Public API Exports
 # =============================================================================
 # These are the main functions/classes users should interact with when using
-# quickforge as a library (as opposed to the CLI)
+# quickforge as a library (as opposed to the CLI).
+#
+# The exports are resolved lazily (PEP 562) so that ``import quickforge`` - and
+# therefore every CLI invocation, including ``quickforge --version`` - does not
+# pay for importing Jinja2, pydantic, and tomlkit up front.
 
-from quickforge.auditor import audit_project
-from quickforge.generator import create_project
-from quickforge.models import ProjectConfig, ProjectType
-from quickforge.upgrader import upgrade_project
+from typing import TYPE_CHECKING
+
+
+if TYPE_CHECKING:
+    from quickforge.auditor import audit_project
+    from quickforge.generator import create_project
+    from quickforge.models import ProjectConfig, ProjectType
+    from quickforge.upgrader import upgrade_project
+
+_LAZY_EXPORTS: dict[str, str] = {
+    "ProjectConfig": "quickforge.models",
+    "ProjectType": "quickforge.models",
+    "audit_project": "quickforge.auditor",
+    "create_project": "quickforge.generator",
+    "upgrade_project": "quickforge.upgrader",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Import public API objects on first access and cache them."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    import importlib
+
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
 
 
 __all__ = [
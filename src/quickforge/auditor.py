@@ -53,9 +53,17 @@ from __future__ import annotations
 
 import ast
 import configparser
+import os
+import sys
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import StrEnum
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING
 
 
 try:
@@ -63,8 +71,11 @@ try:
 except ImportError:
     import tomli as tomllib  # type: ignore[import-not-found]
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
-class AuditCategory(str, Enum):
+
+class AuditCategory(StrEnum):
     """
     Categories of audit findings.
 
@@ -78,7 +89,7 @@ class AuditCategory(str, Enum):
     CODE_QUALITY = "code_quality"
 
 
-class Severity(str, Enum):
+class Severity(StrEnum):
     """
     Severity levels for audit findings.
 
@@ -91,7 +102,7 @@ class Severity(str, Enum):
     CRITICAL = "critical"  # Fix immediately
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Recommendation:
     """
     A single audit recommendation.
@@ -120,8 +131,15 @@ class Recommendation:
     file_path: Path | None = None
     action: str | None = None
 
+    def __post_init__(self) -> None:
+        # Audits repeat the same canned texts; intern them so identical
+        # recommendations share one string each.
+        object.__setattr__(self, "message", sys.intern(self.message))
+        if self.action is not None:
+            object.__setattr__(self, "action", sys.intern(self.action))
+
 
-@dataclass
+@dataclass(slots=True)
 class AuditResult:
     """
     Result of a project audit.
@@ -146,25 +164,43 @@ class AuditResult:
     score: int = 100
     tooling_detected: dict[str, str] = field(default_factory=dict)
 
+    # (number of recommendations counted, counts) - see severity_counts
+    _severity_counts: tuple[int, Counter[Severity]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def severity_counts(self) -> Counter[Severity]:
+        """
+        Number of recommendations per severity, counted in a single pass.
+
+        The result is reused until more recommendations are appended.
+        """
+        cached = self._severity_counts
+        if cached is None or cached[0] != len(self.recommendations):
+            counts = Counter(r.severity for r in self.recommendations)
+            cached = self._severity_counts = (len(self.recommendations), counts)
+        return cached[1]
+
     @property
     def critical_count(self) -> int:
         """Number of critical severity recommendations."""
-        return sum(1 for r in self.recommendations if r.severity == Severity.CRITICAL)
+        return self.severity_counts[Severity.CRITICAL]
 
     @property
     def error_count(self) -> int:
         """Number of error severity recommendations."""
-        return sum(1 for r in self.recommendations if r.severity == Severity.ERROR)
+        return self.severity_counts[Severity.ERROR]
 
     @property
     def warning_count(self) -> int:
         """Number of warning severity recommendations."""
-        return sum(1 for r in self.recommendations if r.severity == Severity.WARNING)
+        return self.severity_counts[Severity.WARNING]
 
     @property
     def info_count(self) -> int:
         """Number of info severity recommendations."""
-        return sum(1 for r in self.recommendations if r.severity == Severity.INFO)
+        return self.severity_counts[Severity.INFO]
 
 
 # =============================================================================
@@ -172,27 +208,111 @@ class AuditResult:
 # =============================================================================
 
 
+@dataclass(frozen=True, slots=True)
+class _ProjectIndex:
+    """
+    Snapshot of a project root listing, shared by the detectors.
+
+    Almost every detector check is "does this file exist in the project
+    root?", so the root is listed once and the checks become set lookups.
+
+    Attributes
+    ----------
+    top_level : frozenset[str]
+        Names of all entries (files and directories) in the project root.
+
+    has_github_workflows : bool
+        Whether .github/workflows is a directory.
+
+    has_pre_commit_config : bool
+        Whether .pre-commit-config.yaml is present.
+    """
+
+    top_level: frozenset[str]
+    has_github_workflows: bool
+    has_pre_commit_config: bool
+
+    @classmethod
+    def scan(cls, path: Path) -> _ProjectIndex:
+        """List `path` with a single scandir call."""
+        try:
+            with os.scandir(path) as entries:
+                top_level = frozenset(entry.name for entry in entries)
+        except OSError:
+            top_level = frozenset()
+        return cls(
+            top_level=top_level,
+            has_github_workflows=(
+                ".github" in top_level and (path / ".github" / "workflows").is_dir()
+            ),
+            has_pre_commit_config=".pre-commit-config.yaml" in top_level,
+        )
+
+
 def _read_toml(path: Path) -> dict | None:
-    """Read a TOML file and return its contents."""
-    if not path.exists():
+    """
+    Read a TOML file and return its contents.
+
+    Every detector reads pyproject.toml, so parsed results are cached per
+    file version (path, mtime, size). The returned dict is shared between
+    callers and must not be modified.
+    """
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    return _load_toml(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_toml(path: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse a TOML file; the stat fields only serve as cache key."""
     try:
-        with path.open("rb") as f:
+        with Path(path).open("rb") as f:
             return tomllib.load(f)
-    except Exception:
+    except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError):
         return None
 
 
 def _read_ini(path: Path) -> configparser.ConfigParser | None:
-    """Read an INI-style config file."""
-    if not path.exists():
+    """
+    Read an INI-style config file.
+
+    Cached like `_read_toml`, since several detectors check setup.cfg. The
+    returned parser is shared between callers and must not be modified.
+    """
+    try:
+        st = path.stat()
+    except OSError:
         return None
+    return _load_ini(str(path), st.st_mtime_ns, st.st_size)
+
+
+@lru_cache(maxsize=256)
+def _load_ini(path: str, mtime_ns: int, size: int) -> configparser.ConfigParser | None:
+    """Parse an INI file; the stat fields only serve as cache key."""
     try:
         config = configparser.ConfigParser()
         config.read(path)
-        return config
-    except Exception:
+    except (UnicodeDecodeError, configparser.Error):
         return None
+    return config
+
+
+def _pyproject_tools(path: Path, index: _ProjectIndex) -> dict:
+    """Return the ``[tool]`` table of a project's pyproject.toml (or ``{}``)."""
+    if "pyproject.toml" not in index.top_level:
+        return {}
+    pyproject = _read_toml(path / "pyproject.toml")
+    tools = pyproject.get("tool") if pyproject else None
+    return tools if isinstance(tools, dict) else {}
+
+
+def _setup_cfg(path: Path, index: _ProjectIndex) -> configparser.ConfigParser | None:
+    """Return the project's parsed setup.cfg, if it has one."""
+    if "setup.cfg" not in index.top_level:
+        return None
+    return _read_ini(path / "setup.cfg")
 
 
 def detect_package_manager(path: Path) -> tuple[str | None, dict[str, str]]:
@@ -210,54 +330,65 @@ def detect_package_manager(path: Path) -> tuple[str | None, dict[str, str]]:
         Tuple of (package_manager_name, extra_info).
         Returns (None, {}) if no package manager detected.
     """
+    return _detect_package_manager(path, _ProjectIndex.scan(path))
+
+
+def _detect_package_manager(
+    path: Path, index: _ProjectIndex
+) -> tuple[str | None, dict[str, str]]:
+    """Detect the package manager used by a project, given a listing of its root."""
     info: dict[str, str] = {}
 
     # Check for uv (modern)
-    if (path / "uv.lock").exists():
+    if "uv.lock" in index.top_level:
         return "uv", {"lock_file": "uv.lock"}
 
     # Check for Poetry
-    if (path / "poetry.lock").exists():
+    if "poetry.lock" in index.top_level:
         info["lock_file"] = "poetry.lock"
         return "poetry", info
 
-    pyproject = _read_toml(path / "pyproject.toml")
-    if pyproject:
-        # Check for Poetry in pyproject.toml
-        if "tool" in pyproject and "poetry" in pyproject["tool"]:
-            return "poetry", {"config": "pyproject.toml"}
+    tools = _pyproject_tools(path, index)
 
-        # Check for PDM
-        if "tool" in pyproject and "pdm" in pyproject["tool"]:
-            return "pdm", {"config": "pyproject.toml"}
+    # Check for Poetry in pyproject.toml
+    if "poetry" in tools:
+        return "poetry", {"config": "pyproject.toml"}
 
-        # Check for Hatch
-        if "tool" in pyproject and "hatch" in pyproject["tool"]:
-            return "hatch", {"config": "pyproject.toml"}
+    # Check for PDM
+    if "pdm" in tools:
+        return "pdm", {"config": "pyproject.toml"}
 
-        # Check for Flit
-        if "tool" in pyproject and "flit" in pyproject["tool"]:
-            return "flit", {"config": "pyproject.toml"}
+    # Check for Hatch
+    if "hatch" in tools:
+        return "hatch", {"config": "pyproject.toml"}
+
+    # Check for Flit
+    if "flit" in tools:
+        return "flit", {"config": "pyproject.toml"}
 
     # Check for Pipenv
-    if (path / "Pipfile").exists() or (path / "Pipfile.lock").exists():
+    if "Pipfile" in index.top_level or "Pipfile.lock" in index.top_level:
         return "pipenv", {"config": "Pipfile"}
 
     # Check for pip/requirements.txt
-    if (path / "requirements.txt").exists():
+    if "requirements.txt" in index.top_level:
         info["requirements"] = "requirements.txt"
         # Check for additional requirements files
-        for req_file in path.glob("requirements*.txt"):
-            if req_file.name != "requirements.txt":
-                info[req_file.name] = str(req_file.name)
+        info.update(
+            (name, name)
+            for name in sorted(index.top_level)
+            if name.startswith("requirements")
+            and name.endswith(".txt")
+            and name != "requirements.txt"
+        )
         return "pip", info
 
     # Check for setup.py (legacy setuptools)
-    if (path / "setup.py").exists():
+    if "setup.py" in index.top_level:
         return "setuptools", {"config": "setup.py"}
 
     # Check for setup.cfg
-    if (path / "setup.cfg").exists():
+    if "setup.cfg" in index.top_level:
         return "setuptools", {"config": "setup.cfg"}
 
     return None, {}
@@ -277,29 +408,36 @@ def detect_linter(path: Path) -> tuple[str | None, dict[str, str]]:
     tuple[str | None, dict[str, str]]
         Tuple of (linter_name, extra_info).
     """
+    return _detect_linter(path, _ProjectIndex.scan(path))
+
+
+def _detect_linter(
+    path: Path, index: _ProjectIndex
+) -> tuple[str | None, dict[str, str]]:
+    """Detect the linter used by a project, given a listing of its root."""
     info: dict[str, str] = {}
 
-    pyproject = _read_toml(path / "pyproject.toml")
+    tools = _pyproject_tools(path, index)
 
     # Check for ruff (modern)
-    if (path / "ruff.toml").exists():
+    if "ruff.toml" in index.top_level:
         return "ruff", {"config": "ruff.toml"}
-    if pyproject and "tool" in pyproject and "ruff" in pyproject["tool"]:
+    if "ruff" in tools:
         return "ruff", {"config": "pyproject.toml"}
 
     # Check for flake8
-    if (path / ".flake8").exists():
+    if ".flake8" in index.top_level:
         return "flake8", {"config": ".flake8"}
-    setup_cfg = _read_ini(path / "setup.cfg")
+    setup_cfg = _setup_cfg(path, index)
     if setup_cfg and setup_cfg.has_section("flake8"):
         return "flake8", {"config": "setup.cfg"}
 
     # Check for pylint
-    if (path / ".pylintrc").exists():
+    if ".pylintrc" in index.top_level:
         return "pylint", {"config": ".pylintrc"}
-    if (path / "pylintrc").exists():
+    if "pylintrc" in index.top_level:
         return "pylint", {"config": "pylintrc"}
-    if pyproject and "tool" in pyproject and "pylint" in pyproject["tool"]:
+    if "pylint" in tools:
         return "pylint", {"config": "pyproject.toml"}
 
     return None, info
@@ -319,31 +457,40 @@ def detect_formatter(path: Path) -> tuple[str | None, dict[str, str]]:
     tuple[str | None, dict[str, str]]
         Tuple of (formatter_name, extra_info).
     """
+    return _detect_formatter(path, _ProjectIndex.scan(path))
+
+
+def _detect_formatter(
+    path: Path, index: _ProjectIndex
+) -> tuple[str | None, dict[str, str]]:
+    """Detect the formatter used by a project, given a listing of its root."""
     info: dict[str, str] = {}
 
-    pyproject = _read_toml(path / "pyproject.toml")
+    tools = _pyproject_tools(path, index)
 
-    # Check for ruff format (modern)
-    if pyproject and "tool" in pyproject and "ruff" in pyproject["tool"]:
-        ruff_config = pyproject["tool"]["ruff"]
-        if "format" in ruff_config or "line-length" in ruff_config:
-            return "ruff", {"config": "pyproject.toml"}
+    # Check for ruff format (modern); a malformed non-table [tool.ruff] is
+    # ignored
+    ruff_config = tools.get("ruff")
+    if isinstance(ruff_config, dict) and (
+        "format" in ruff_config or "line-length" in ruff_config
+    ):
+        return "ruff", {"config": "pyproject.toml"}
 
     # Check for Black
-    if pyproject and "tool" in pyproject and "black" in pyproject["tool"]:
+    if "black" in tools:
         return "black", {"config": "pyproject.toml"}
 
     # Check for autopep8
-    if pyproject and "tool" in pyproject and "autopep8" in pyproject["tool"]:
+    if "autopep8" in tools:
         return "autopep8", {"config": "pyproject.toml"}
-    setup_cfg = _read_ini(path / "setup.cfg")
+    setup_cfg = _setup_cfg(path, index)
     if setup_cfg and setup_cfg.has_section("autopep8"):
         return "autopep8", {"config": "setup.cfg"}
 
     # Check for yapf
-    if (path / ".style.yapf").exists():
+    if ".style.yapf" in index.top_level:
         return "yapf", {"config": ".style.yapf"}
-    if pyproject and "tool" in pyproject and "yapf" in pyproject["tool"]:
+    if "yapf" in tools:
         return "yapf", {"config": "pyproject.toml"}
 
     return None, info
@@ -363,27 +510,34 @@ def detect_import_sorter(path: Path) -> tuple[str | None, dict[str, str]]:
     tuple[str | None, dict[str, str]]
         Tuple of (sorter_name, extra_info).
     """
-    pyproject = _read_toml(path / "pyproject.toml")
+    return _detect_import_sorter(path, _ProjectIndex.scan(path))
+
+
+def _detect_import_sorter(
+    path: Path, index: _ProjectIndex
+) -> tuple[str | None, dict[str, str]]:
+    """Detect the import sorter used by a project, given a listing of its root."""
+    tools = _pyproject_tools(path, index)
 
-    # Check for ruff isort (modern)
-    if pyproject and "tool" in pyproject and "ruff" in pyproject["tool"]:
-        ruff_config = pyproject["tool"]["ruff"]
-        if "lint" in ruff_config and "isort" in ruff_config.get("lint", {}):
+    # Check for ruff isort (modern); malformed non-table values are ignored
+    ruff_config = tools.get("ruff")
+    lint = ruff_config.get("lint") if isinstance(ruff_config, dict) else None
+    if isinstance(lint, dict):
+        if "isort" in lint:
+            return "ruff", {"config": "pyproject.toml"}
+        # Check if isort rules are enabled (one pass; "I" itself also matches)
+        select = lint.get("select")
+        if isinstance(select, list) and any(
+            isinstance(code, str) and code.startswith("I") for code in select
+        ):
             return "ruff", {"config": "pyproject.toml"}
-        # Check if isort rules are enabled
-        if "lint" in ruff_config:
-            select = ruff_config.get("lint", {}).get("select", [])
-            if "I" in select or any(
-                s.startswith("I") for s in select if isinstance(s, str)
-            ):
-                return "ruff", {"config": "pyproject.toml"}
 
     # Check for isort
-    if (path / ".isort.cfg").exists():
+    if ".isort.cfg" in index.top_level:
         return "isort", {"config": ".isort.cfg"}
-    if pyproject and "tool" in pyproject and "isort" in pyproject["tool"]:
+    if "isort" in tools:
         return "isort", {"config": "pyproject.toml"}
-    setup_cfg = _read_ini(path / "setup.cfg")
+    setup_cfg = _setup_cfg(path, index)
     if setup_cfg and setup_cfg.has_section("isort"):
         return "isort", {"config": "setup.cfg"}
 
@@ -404,31 +558,38 @@ def detect_type_checker(path: Path) -> tuple[str | None, dict[str, str]]:
     tuple[str | None, dict[str, str]]
         Tuple of (type_checker_name, extra_info).
     """
-    pyproject = _read_toml(path / "pyproject.toml")
+    return _detect_type_checker(path, _ProjectIndex.scan(path))
+
+
+def _detect_type_checker(
+    path: Path, index: _ProjectIndex
+) -> tuple[str | None, dict[str, str]]:
+    """Detect the type checker used by a project, given a listing of its root."""
+    tools = _pyproject_tools(path, index)
 
     # Check for basedpyright (modern)
-    if pyproject and "tool" in pyproject and "basedpyright" in pyproject["tool"]:
+    if "basedpyright" in tools:
         return "basedpyright", {"config": "pyproject.toml"}
 
     # Check for pyright
-    if (path / "pyrightconfig.json").exists():
+    if "pyrightconfig.json" in index.top_level:
         return "pyright", {"config": "pyrightconfig.json"}
-    if pyproject and "tool" in pyproject and "pyright" in pyproject["tool"]:
+    if "pyright" in tools:
         return "pyright", {"config": "pyproject.toml"}
 
     # Check for mypy
-    if (path / "mypy.ini").exists():
+    if "mypy.ini" in index.top_level:
         return "mypy", {"config": "mypy.ini"}
-    if (path / ".mypy.ini").exists():
+    if ".mypy.ini" in index.top_level:
         return "mypy", {"config": ".mypy.ini"}
-    if pyproject and "tool" in pyproject and "mypy" in pyproject["tool"]:
+    if "mypy" in tools:
         return "mypy", {"config": "pyproject.toml"}
-    setup_cfg = _read_ini(path / "setup.cfg")
+    setup_cfg = _setup_cfg(path, index)
     if setup_cfg and setup_cfg.has_section("mypy"):
         return "mypy", {"config": "setup.cfg"}
 
     # Check for pytype
-    if (path / "pytype.cfg").exists():
+    if "pytype.cfg" in index.top_level:
         return "pytype", {"config": "pytype.cfg"}
 
     return None, {}
@@ -436,7 +597,12 @@ def detect_type_checker(path: Path) -> tuple[str | None, dict[str, str]]:
 
 def detect_pre_commit(path: Path) -> bool:
     """Check if pre-commit is configured."""
-    return (path / ".pre-commit-config.yaml").exists()
+    return _detect_pre_commit(path, _ProjectIndex.scan(path))
+
+
+def _detect_pre_commit(path: Path, index: _ProjectIndex) -> bool:
+    """Check if pre-commit is configured, given a listing of the root."""
+    return index.has_pre_commit_config
 
 
 def detect_ci(path: Path) -> tuple[str | None, dict[str, str]]:
@@ -453,32 +619,169 @@ def detect_ci(path: Path) -> tuple[str | None, dict[str, str]]:
     tuple[str | None, dict[str, str]]
         Tuple of (ci_name, extra_info).
     """
+    return _detect_ci(path, _ProjectIndex.scan(path))
+
+
+def _detect_ci(path: Path, index: _ProjectIndex) -> tuple[str | None, dict[str, str]]:
+    """Detect CI/CD configuration, given a listing of its root."""
     # GitHub Actions (workflows may use either .yml or .yaml)
-    gh_workflows = path / ".github" / "workflows"
-    if gh_workflows.exists():
-        workflows = list(gh_workflows.glob("*.yml")) + list(gh_workflows.glob("*.yaml"))
-        if workflows:
-            return "github-actions", {"workflows": str(len(workflows))}
+    workflows = 0
+    if index.has_github_workflows:
+        try:
+            with os.scandir(path / ".github" / "workflows") as entries:
+                workflows = sum(
+                    1
+                    for entry in entries
+                    if entry.name.endswith((".yml", ".yaml")) and entry.is_file()
+                )
+        except OSError:
+            pass
+    if workflows:
+        return "github-actions", {"workflows": str(workflows)}
 
     # GitLab CI
-    if (path / ".gitlab-ci.yml").exists():
+    if ".gitlab-ci.yml" in index.top_level:
         return "gitlab-ci", {"config": ".gitlab-ci.yml"}
 
     # Travis CI
-    if (path / ".travis.yml").exists():
+    if ".travis.yml" in index.top_level:
         return "travis-ci", {"config": ".travis.yml"}
 
     # CircleCI
-    if (path / ".circleci" / "config.yml").exists():
+    if ".circleci" in index.top_level and (path / ".circleci" / "config.yml").exists():
         return "circleci", {"config": ".circleci/config.yml"}
 
     # Azure Pipelines
-    if (path / "azure-pipelines.yml").exists():
+    if "azure-pipelines.yml" in index.top_level:
         return "azure-pipelines", {"config": "azure-pipelines.yml"}
 
     return None, {}
 
 
+# Common non-source directories skipped when looking for Python files
+_EXCLUDED_DIRS = frozenset(
+    {
+        "venv",
+        ".venv",
+        "env",
+        ".env",
+        "node_modules",
+        "__pycache__",
+        ".git",
+        "build",
+        "dist",
+    }
+)
+
+# Below this many files, process start-up costs more than the parsing saves
+_PARALLEL_MIN_FILES = 64
+
+
+def _walk_python(root: Path) -> Iterator[str]:
+    """
+    Yield the paths of all ``.py`` files below ``root``.
+
+    Excluded directories are pruned before descending, so large trees such
+    as virtualenvs and node_modules are never listed. Symlinked directories
+    are not followed.
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _EXCLUDED_DIRS:
+                            stack.append(entry.path)
+                    elif entry.name.endswith(".py") and entry.is_file():
+                        yield entry.path
+        except OSError:
+            continue
+
+
+# Statement-list fields that can contain (nested) function definitions
+_BLOCK_FIELDS = ("body", "orelse", "finalbody", "handlers", "cases")
+
+
+def _iter_function_defs(
+    tree: ast.Module,
+) -> Iterator[ast.FunctionDef | ast.AsyncFunctionDef]:
+    """
+    Yield every function definition in a module, including nested ones.
+
+    Unlike `ast.walk`, only statement blocks are descended into: functions
+    cannot appear inside expressions, so expression subtrees are skipped.
+    """
+    stack: list[ast.AST] = [tree]
+    while stack:
+        node = stack.pop()
+        for field_name in _BLOCK_FIELDS:
+            for child in getattr(node, field_name, ()):
+                if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    yield child
+                stack.append(child)
+
+
+def _coverage_of_file(py_path: str) -> tuple[int, int]:
+    """
+    Count annotated and total functions in one Python file.
+
+    Returns ``(0, 0)`` for files that cannot be read or parsed. Module-level
+    so that it can be sent to worker processes.
+    """
+    typed_functions = 0
+    total_functions = 0
+
+    try:
+        # Parse raw bytes: ast.parse honours PEP 263 coding declarations
+        # itself, so there is no separate decode step.
+        with Path(py_path).open("rb") as f:
+            source = f.read()
+
+        # No "def" anywhere means no functions: skip building the AST
+        # (common for __init__.py and constants modules).
+        if b"def" not in source:
+            return 0, 0
+
+        tree = ast.parse(source, filename=py_path)
+    except (SyntaxError, UnicodeDecodeError):
+        return 0, 0
+
+    for node in _iter_function_defs(tree):
+        total_functions += 1
+
+        # Check if function has return annotation or any parameter annotations
+        args = node.args
+        if node.returns is not None or any(
+            arg.annotation is not None
+            for arg in chain(args.posonlyargs, args.args, args.kwonlyargs)
+        ):
+            typed_functions += 1
+
+    return typed_functions, total_functions
+
+
+def _count_functions(files: list[str]) -> list[tuple[int, int]]:
+    """
+    Return ``(typed, total)`` function counts for each file.
+
+    Large projects are parsed in a process pool since every file is
+    independent. If worker processes cannot be started (restricted
+    environments, missing semaphore support), fall back to parsing serially.
+    """
+    if len(files) >= _PARALLEL_MIN_FILES:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        try:
+            with ProcessPoolExecutor() as executor:
+                return list(executor.map(_coverage_of_file, files, chunksize=32))
+        except (OSError, BrokenProcessPool):
+            pass
+
+    return [_coverage_of_file(py_path) for py_path in files]
+
+
 def analyze_type_coverage(path: Path) -> tuple[float, int, int]:
     """
     Analyze type annotation coverage in Python files.
@@ -496,57 +799,11 @@ def analyze_type_coverage(path: Path) -> tuple[float, int, int]:
     total_functions = 0
     typed_functions = 0
 
-    # Find Python files
-    python_files = list(path.glob("**/*.py"))
-
-    # Exclude common non-source directories
-    exclude_patterns = {
-        "venv",
-        ".venv",
-        "env",
-        ".env",
-        "node_modules",
-        "__pycache__",
-        ".git",
-        "build",
-        "dist",
-    }
-
-    for py_file in python_files:
-        # Skip excluded directories
-        if any(part in exclude_patterns for part in py_file.parts):
-            continue
+    files = list(_walk_python(path))
 
-        try:
-            with py_file.open(encoding="utf-8") as f:
-                source = f.read()
-
-            tree = ast.parse(source)
-
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                    total_functions += 1
-
-                    # Check if function has return annotation or any parameter annotations
-                    has_annotation = False
-
-                    if node.returns is not None:
-                        has_annotation = True
-                    else:
-                        for arg in (
-                            node.args.args
-                            + node.args.posonlyargs
-                            + node.args.kwonlyargs
-                        ):
-                            if arg.annotation is not None:
-                                has_annotation = True
-                                break
-
-                    if has_annotation:
-                        typed_functions += 1
-
-        except (SyntaxError, UnicodeDecodeError):
-            continue
+    for typed, total in _count_functions(files):
+        typed_functions += typed
+        total_functions += total
 
     if total_functions == 0:
         return 100.0, 0, 0
@@ -560,6 +817,124 @@ def analyze_type_coverage(path: Path) -> tuple[float, int, int]:
 # =============================================================================
 
 
+def _tooling_rec(
+    message: str, severity: Severity, action: str | None = None
+) -> Recommendation:
+    """Build a shared tooling recommendation for the lookup tables below."""
+    return Recommendation(AuditCategory.TOOLING, message, severity, action=action)
+
+
+# Recommendations keyed by the detected tool. Recommendation is frozen, so the
+# same instances are appended to every audit result.
+_PKG_MANAGER_RECS: MappingProxyType[str | None, Recommendation] = MappingProxyType(
+    {
+        "poetry": _tooling_rec(
+            "Consider migrating from Poetry to uv for faster dependency resolution",
+            Severity.INFO,
+            "quickforge upgrade . --from poetry",
+        ),
+        "pip": _tooling_rec(
+            "Consider migrating from pip/requirements.txt to uv with pyproject.toml",
+            Severity.INFO,
+            "quickforge upgrade . --from pip",
+        ),
+        "pipenv": _tooling_rec(
+            "Consider migrating from Pipenv to uv for better performance",
+            Severity.INFO,
+            "quickforge upgrade . --from pipenv",
+        ),
+        "setuptools": _tooling_rec(
+            "Consider migrating from setup.py to pyproject.toml (PEP 621)",
+            Severity.WARNING,
+            "quickforge upgrade . --from setuptools",
+        ),
+        None: _tooling_rec(
+            "No package manager detected. Consider adding a pyproject.toml",
+            Severity.WARNING,
+        ),
+    }
+)
+
+_LINTER_RECS: MappingProxyType[str | None, Recommendation] = MappingProxyType(
+    {
+        "flake8": _tooling_rec(
+            "Consider migrating from flake8 to ruff for better performance",
+            Severity.INFO,
+            "quickforge upgrade . (will migrate flake8 to ruff)",
+        ),
+        "pylint": _tooling_rec(
+            "Consider migrating from pylint to ruff for better performance",
+            Severity.INFO,
+            "quickforge upgrade . (will migrate pylint to ruff)",
+        ),
+        None: _tooling_rec(
+            "No linter detected. Consider adding ruff for code quality",
+            Severity.WARNING,
+            "quickforge add pre-commit (includes ruff)",
+        ),
+    }
+)
+
+_FORMATTER_RECS: MappingProxyType[str | None, Recommendation] = MappingProxyType(
+    {
+        "black": _tooling_rec(
+            "Consider migrating from black to ruff format for better performance",
+            Severity.INFO,
+            "quickforge upgrade . (will migrate black to ruff)",
+        ),
+        "autopep8": _tooling_rec(
+            "Consider migrating from autopep8 to ruff format",
+            Severity.INFO,
+        ),
+        "yapf": _tooling_rec(
+            "Consider migrating from yapf to ruff format",
+            Severity.INFO,
+        ),
+    }
+)
+
+_IMPORT_SORTER_RECS: MappingProxyType[str | None, Recommendation] = MappingProxyType(
+    {
+        "isort": _tooling_rec(
+            "Consider migrating from isort to ruff (handles import sorting)",
+            Severity.INFO,
+            "quickforge upgrade . (will migrate isort to ruff)",
+        ),
+    }
+)
+
+_TYPE_CHECKER_RECS: MappingProxyType[str | None, Recommendation] = MappingProxyType(
+    {
+        "mypy": _tooling_rec(
+            "Consider migrating from mypy to basedpyright for stricter checking",
+            Severity.INFO,
+            "quickforge upgrade . (will migrate mypy to basedpyright)",
+        ),
+        "pytype": _tooling_rec(
+            "Consider migrating from pytype to basedpyright",
+            Severity.INFO,
+        ),
+        None: _tooling_rec(
+            "No type checker detected. Consider adding basedpyright",
+            Severity.WARNING,
+        ),
+    }
+)
+
+
+_NO_PRE_COMMIT_REC = _tooling_rec(
+    "No pre-commit hooks detected. Consider adding pre-commit",
+    Severity.INFO,
+    "quickforge add pre-commit",
+)
+
+_NO_CI_REC = _tooling_rec(
+    "No CI/CD configuration detected. Consider adding GitHub Actions",
+    Severity.INFO,
+    "quickforge add github-actions",
+)
+
+
 def _generate_tooling_recommendations(
     result: AuditResult,
     pkg_manager: str | None,
@@ -571,168 +946,45 @@ def _generate_tooling_recommendations(
     ci_system: str | None,
 ) -> None:
     """Generate recommendations for tooling improvements."""
-
-    # Package manager recommendations
-    if pkg_manager == "poetry":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from Poetry to uv for faster dependency resolution",
-                severity=Severity.INFO,
-                action="quickforge upgrade . --from poetry",
-            )
-        )
-    elif pkg_manager == "pip":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from pip/requirements.txt to uv with pyproject.toml",
-                severity=Severity.INFO,
-                action="quickforge upgrade . --from pip",
-            )
-        )
-    elif pkg_manager == "pipenv":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from Pipenv to uv for better performance",
-                severity=Severity.INFO,
-                action="quickforge upgrade . --from pipenv",
-            )
-        )
-    elif pkg_manager == "setuptools":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from setup.py to pyproject.toml (PEP 621)",
-                severity=Severity.WARNING,
-                action="quickforge upgrade . --from setuptools",
-            )
-        )
-    elif pkg_manager is None:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="No package manager detected. Consider adding a pyproject.toml",
-                severity=Severity.WARNING,
-            )
-        )
-
-    # Linter recommendations
-    if linter == "flake8":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from flake8 to ruff for better performance",
-                severity=Severity.INFO,
-                action="quickforge upgrade . (will migrate flake8 to ruff)",
-            )
-        )
-    elif linter == "pylint":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from pylint to ruff for better performance",
-                severity=Severity.INFO,
-                action="quickforge upgrade . (will migrate pylint to ruff)",
-            )
-        )
-    elif linter is None and formatter != "ruff":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="No linter detected. Consider adding ruff for code quality",
-                severity=Severity.WARNING,
-                action="quickforge add pre-commit (includes ruff)",
-            )
-        )
-
-    # Formatter recommendations
-    if formatter == "black":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from black to ruff format for better performance",
-                severity=Severity.INFO,
-                action="quickforge upgrade . (will migrate black to ruff)",
-            )
-        )
-    elif formatter == "autopep8":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from autopep8 to ruff format",
-                severity=Severity.INFO,
-            )
-        )
-    elif formatter == "yapf":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from yapf to ruff format",
-                severity=Severity.INFO,
-            )
-        )
-
-    # Import sorter recommendations
-    if import_sorter == "isort":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from isort to ruff (handles import sorting)",
-                severity=Severity.INFO,
-                action="quickforge upgrade . (will migrate isort to ruff)",
-            )
-        )
-
-    # Type checker recommendations
-    if type_checker == "mypy":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from mypy to basedpyright for stricter checking",
-                severity=Severity.INFO,
-                action="quickforge upgrade . (will migrate mypy to basedpyright)",
-            )
-        )
-    elif type_checker == "pytype":
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="Consider migrating from pytype to basedpyright",
-                severity=Severity.INFO,
-            )
-        )
-    elif type_checker is None:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="No type checker detected. Consider adding basedpyright",
-                severity=Severity.WARNING,
-            )
-        )
+    recs = [
+        _PKG_MANAGER_RECS.get(pkg_manager),
+        # ruff used only as formatter still covers linting
+        _LINTER_RECS.get(linter) if linter or formatter != "ruff" else None,
+        _FORMATTER_RECS.get(formatter),
+        _IMPORT_SORTER_RECS.get(import_sorter),
+        _TYPE_CHECKER_RECS.get(type_checker),
+    ]
+    result.recommendations.extend(rec for rec in recs if rec is not None)
 
     # Pre-commit recommendations
     if not has_pre_commit:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="No pre-commit hooks detected. Consider adding pre-commit",
-                severity=Severity.INFO,
-                action="quickforge add pre-commit",
-            )
-        )
+        result.recommendations.append(_NO_PRE_COMMIT_REC)
 
     # CI recommendations
     if ci_system is None:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.TOOLING,
-                message="No CI/CD configuration detected. Consider adding GitHub Actions",
-                severity=Severity.INFO,
-                action="quickforge add github-actions",
-            )
-        )
+        result.recommendations.append(_NO_CI_REC)
+
+
+# Upper bounds (exclusive) of the type coverage bands below
+_COVERAGE_THRESHOLDS = (25, 50, 80)
+
+# Severity and message for each coverage band below 80%
+_COVERAGE_BANDS: tuple[tuple[Severity, str], ...] = (
+    (
+        Severity.WARNING,
+        "Low type annotation coverage ({coverage:.0f}%). "
+        "Only {typed}/{total} functions have type hints",
+    ),
+    (
+        Severity.INFO,
+        "Moderate type annotation coverage ({coverage:.0f}%). "
+        "{typed}/{total} functions have type hints",
+    ),
+    (
+        Severity.INFO,
+        "Good type annotation coverage ({coverage:.0f}%). Consider improving to 80%+",
+    ),
+)
 
 
 def _generate_code_quality_recommendations(
@@ -746,50 +998,41 @@ def _generate_code_quality_recommendations(
     if total_functions == 0:
         return
 
-    if type_coverage < 25:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.CODE_QUALITY,
-                message=f"Low type annotation coverage ({type_coverage:.0f}%). "
-                f"Only {typed_functions}/{total_functions} functions have type hints",
-                severity=Severity.WARNING,
-            )
-        )
-    elif type_coverage < 50:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.CODE_QUALITY,
-                message=f"Moderate type annotation coverage ({type_coverage:.0f}%). "
-                f"{typed_functions}/{total_functions} functions have type hints",
-                severity=Severity.INFO,
-            )
-        )
-    elif type_coverage < 80:
-        result.recommendations.append(
-            Recommendation(
-                category=AuditCategory.CODE_QUALITY,
-                message=f"Good type annotation coverage ({type_coverage:.0f}%). "
-                f"Consider improving to 80%+",
-                severity=Severity.INFO,
-            )
+    band = bisect_right(_COVERAGE_THRESHOLDS, type_coverage)
+    if band == len(_COVERAGE_THRESHOLDS):
+        return  # 80% or more needs no recommendation
+
+    severity, template = _COVERAGE_BANDS[band]
+    result.recommendations.append(
+        Recommendation(
+            category=AuditCategory.CODE_QUALITY,
+            message=template.format(
+                coverage=type_coverage, typed=typed_functions, total=total_functions
+            ),
+            severity=severity,
         )
+    )
 
 
-def _calculate_score(result: AuditResult) -> int:
-    """Calculate overall project health score."""
-    score = 100
+# Score deducted per recommendation of each severity
+_SEVERITY_PENALTIES: MappingProxyType[Severity, int] = MappingProxyType(
+    {
+        Severity.CRITICAL: 20,
+        Severity.ERROR: 10,
+        Severity.WARNING: 5,
+        Severity.INFO: 1,
+    }
+)
 
-    for rec in result.recommendations:
-        if rec.severity == Severity.CRITICAL:
-            score -= 20
-        elif rec.severity == Severity.ERROR:
-            score -= 10
-        elif rec.severity == Severity.WARNING:
-            score -= 5
-        elif rec.severity == Severity.INFO:
-            score -= 1
 
-    return max(0, min(100, score))
+def _calculate_score(result: AuditResult) -> int:
+    """Calculate overall project health score."""
+    counts = result.severity_counts
+    penalty = sum(
+        counts[severity] * points for severity, points in _SEVERITY_PENALTIES.items()
+    )
+    # Penalties only ever lower the score, so only the lower bound can apply
+    return max(0, 100 - penalty)
 
 
 # =============================================================================
@@ -827,14 +1070,16 @@ def audit_project(path: Path) -> AuditResult:
 
     result = AuditResult(project_path=path)
 
-    # Detect tooling
-    pkg_manager, _pkg_info = detect_package_manager(path)
-    linter, _linter_info = detect_linter(path)
-    formatter, _formatter_info = detect_formatter(path)
-    import_sorter, _sorter_info = detect_import_sorter(path)
-    type_checker, _tc_info = detect_type_checker(path)
-    has_pre_commit = detect_pre_commit(path)
-    ci_system, _ci_info = detect_ci(path)
+    # Detect tooling. The project root is listed once for all detectors,
+    # which then mostly answer from that listing.
+    index = _ProjectIndex.scan(path)
+    pkg_manager, _pkg_info = _detect_package_manager(path, index)
+    linter, _linter_info = _detect_linter(path, index)
+    formatter, _formatter_info = _detect_formatter(path, index)
+    import_sorter, _sorter_info = _detect_import_sorter(path, index)
+    type_checker, _tc_info = _detect_type_checker(path, index)
+    has_pre_commit = _detect_pre_commit(path, index)
+    ci_system, _ci_info = _detect_ci(path, index)
 
     # Record detected tools
     if pkg_manager:
@@ -852,10 +1097,6 @@ def audit_project(path: Path) -> AuditResult:
     if ci_system:
         result.tooling_detected["ci"] = ci_system
 
-    # Analyze type coverage
-    type_coverage, typed_functions, total_functions = analyze_type_coverage(path)
-    result.tooling_detected["type_coverage"] = f"{type_coverage:.0f}%"
-
     # Check if already using modern tooling
     is_modern = (
         pkg_manager == "uv"
@@ -867,6 +1108,11 @@ def audit_project(path: Path) -> AuditResult:
     if is_modern:
         result.tooling_detected["status"] = "modern"
     else:
+        # Analyze type coverage. Only the code quality recommendations use
+        # it, so modern projects skip parsing their sources altogether.
+        type_coverage, typed_functions, total_functions = analyze_type_coverage(path)
+        result.tooling_detected["type_coverage"] = f"{type_coverage:.0f}%"
+
         # Generate recommendations
         _generate_tooling_recommendations(
             result,
@@ -39,34 +39,37 @@ See Also
 
 from __future__ import annotations
 
+import os
+import sys
+from functools import cache
 from pathlib import Path
-from typing import Annotated
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Annotated, TypeVar
 
-import questionary
 import typer
-from rich import print as rprint
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
 
 from quickforge import __version__
-from quickforge.auditor import Severity, audit_project
-from quickforge.generator import (
-    FEATURE_TEMPLATES,
-    add_feature_to_project,
-    create_project,
-)
-from quickforge.models import (
-    AuthorInfo,
-    FeaturesConfig,
-    License,
-    ProjectConfig,
-    ProjectType,
-    PythonVersion,
-    ToolingConfig,
-    TypeCheckingMode,
-)
-from quickforge.upgrader import create_migration_plan, upgrade_project
+
+
+# Everything beyond typer is imported inside the functions that use it, so
+# `quickforge --version` and `--help` never load questionary (prompt_toolkit),
+# rich rendering, Jinja2, or pydantic.
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from enum import Enum
+
+    from rich.console import Console
+
+    from quickforge.auditor import Recommendation
+    from quickforge.models import (
+        AuthorInfo,
+        FeaturesConfig,
+        License,
+        ProjectConfig,
+        ProjectType,
+        PythonVersion,
+        TypeCheckingMode,
+    )
 
 
 # =============================================================================
@@ -82,8 +85,51 @@ app = typer.Typer(
     add_completion=True,
 )
 
-# Console for rich output
-console = Console()
+
+def _get_console() -> Console:
+    """
+    Return the shared rich console, creating it on first use.
+
+    This is the console ``rich.print`` writes to, so tables, panels and
+    one-off messages share a single terminal capability probe, and
+    commands that print nothing never pay for it.
+
+    Returns
+    -------
+    Console
+        The process-wide rich console.
+    """
+    from rich import get_console
+
+    return get_console()
+
+
+def _err(message: str, hint: str | None = None) -> None:
+    """
+    Print an error message, with an optional hint line below it.
+
+    On a terminal the message is styled through rich. When stdout is
+    piped it is written as plain text, bypassing rich's markup parser.
+
+    Parameters
+    ----------
+    message : str
+        The error message, shown after an ``Error:`` prefix.
+    hint : str | None
+        Optional follow-up line, shown dimmed on a terminal.
+    """
+    if not sys.stdout.isatty():
+        sys.stdout.write(f"Error: {message}\n")
+        if hint:
+            sys.stdout.write(f"{hint}\n")
+        return
+
+    from rich.markup import escape
+
+    console = _get_console()
+    console.print(f"[red]Error:[/] {escape(message)}")
+    if hint:
+        console.print(f"[dim]{escape(hint)}[/]")
 
 
 # =============================================================================
@@ -104,7 +150,9 @@ def version_callback(value: bool) -> None:
         True if --version was passed.
     """
     if value:
-        console.print(
+        from rich.panel import Panel
+
+        _get_console().print(
             Panel(
                 f"[bold green]quickforge[/] version [cyan]{__version__}[/]\n\n"
                 f"[dim]Modern Python project bootstrapper[/]\n"
@@ -115,6 +163,263 @@ def version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+# =============================================================================
+# Plain-Text Prompt Fallback
+# =============================================================================
+
+_T = TypeVar("_T")
+
+
+def _use_simple_prompts() -> bool:
+    """
+    Decide whether to use plain ``input()`` prompts instead of questionary.
+
+    questionary pulls in prompt_toolkit, which is slow to import and
+    needs a real terminal. The plain prompts are used when
+    ``QUICKFORGE_SIMPLE_PROMPTS=1`` is set, when running under CI, or
+    when stdin/stdout is not a TTY.
+
+    Returns
+    -------
+    bool
+        True if the plain-text prompts should be used.
+    """
+    if os.environ.get("QUICKFORGE_SIMPLE_PROMPTS") == "1" or os.environ.get("CI"):
+        return True
+    return not (sys.stdin.isatty() and sys.stdout.isatty())
+
+
+def _read_line(prompt: str) -> str:
+    """Read one stripped line of input, aborting on EOF."""
+    try:
+        return input(prompt).strip()
+    except EOFError:
+        raise typer.Abort() from None
+
+
+def _simple_select(question: str, choices: Sequence[tuple[str, _T]], default: _T) -> _T:
+    """
+    Prompt for a single choice from a numbered list.
+
+    Parameters
+    ----------
+    question : str
+        The question to display.
+    choices : Sequence[tuple[str, T]]
+        ``(title, value)`` pairs in display order.
+    default : T
+        Value returned when the user just presses Enter.
+
+    Returns
+    -------
+    T
+        The value of the selected choice.
+    """
+    default_index = 1
+    typer.echo(question)
+    for index, (title, value) in enumerate(choices, start=1):
+        marker = ""
+        if value == default:
+            default_index = index
+            marker = " (default)"
+        typer.echo(f"  [{index}] {title}{marker}")
+
+    while True:
+        answer = _read_line(f"Choice [{default_index}]: ")
+        if not answer:
+            return default
+        if answer.isdigit() and 1 <= int(answer) <= len(choices):
+            return choices[int(answer) - 1][1]
+        typer.echo(f"Please enter a number between 1 and {len(choices)}.")
+
+
+def _simple_checkbox(
+    question: str, choices: Sequence[tuple[str, _T, bool]]
+) -> list[_T]:
+    """
+    Prompt for any number of choices as comma-separated numbers.
+
+    Parameters
+    ----------
+    question : str
+        The question to display.
+    choices : Sequence[tuple[str, T, bool]]
+        ``(title, value, checked)`` triples in display order.
+
+    Returns
+    -------
+    list[T]
+        Values of the selected choices. An empty answer keeps the
+        choices that are checked by default; ``-`` selects none.
+    """
+    typer.echo(question)
+    defaults = []
+    for index, (title, _, checked) in enumerate(choices, start=1):
+        if checked:
+            defaults.append(str(index))
+        typer.echo(f"  [{index}] {title}")
+
+    while True:
+        answer = _read_line(f"Numbers, comma-separated [{','.join(defaults)}]: ")
+        if not answer:
+            return [value for _, value, checked in choices if checked]
+        if answer == "-":
+            return []
+        parts = [part.strip() for part in answer.split(",") if part.strip()]
+        if all(p.isdigit() and 1 <= int(p) <= len(choices) for p in parts):
+            selected = {int(p) for p in parts}
+            return [
+                value
+                for index, (_, value, _) in enumerate(choices, start=1)
+                if index in selected
+            ]
+        typer.echo(f"Please enter numbers between 1 and {len(choices)}.")
+
+
+def _simple_text(question: str, default: str) -> str:
+    """Prompt for free text, returning ``default`` on an empty answer."""
+    suffix = f" [{default}]" if default else ""
+    return _read_line(f"{question}{suffix} ") or default
+
+
+def _simple_confirm(question: str) -> bool:
+    """Ask a yes/no question that defaults to yes."""
+    while True:
+        answer = _read_line(f"{question} [Y/n] ").lower()
+        if answer in {"", "y", "yes"}:
+            return True
+        if answer in {"n", "no"}:
+            return False
+
+
+def _confirm(question: str) -> bool:
+    """
+    Ask a yes/no question that defaults to yes.
+
+    questionary is only imported when the plain-text fallback is not in
+    use, and only at the point a confirmation is actually needed.
+
+    Parameters
+    ----------
+    question : str
+        The question to display.
+
+    Returns
+    -------
+    bool
+        True if the user confirmed; False if they declined or cancelled.
+    """
+    if _use_simple_prompts():
+        return _simple_confirm(question)
+
+    import questionary
+
+    return bool(questionary.confirm(question, default=True).ask())
+
+
+def _select(question: str, choices: Sequence[tuple[str, _T]], default: _T) -> _T:
+    """
+    Prompt for a single choice, using questionary when available.
+
+    Parameters
+    ----------
+    question : str
+        The question to display.
+    choices : Sequence[tuple[str, T]]
+        ``(title, value)`` pairs in display order.
+    default : T
+        The initially selected value.
+
+    Returns
+    -------
+    T
+        The value of the selected choice.
+
+    Raises
+    ------
+    typer.Abort
+        If the user cancels the prompt.
+    """
+    if _use_simple_prompts():
+        return _simple_select(question, choices, default)
+
+    import questionary
+
+    # questionary accepts plain strings as choices, so pass the titles and
+    # map the answer back instead of wrapping every pair in a Choice.
+    by_title = dict(choices)
+    default_title = next(title for title, value in choices if value == default)
+
+    result = questionary.select(
+        question,
+        choices=list(by_title),
+        default=default_title,
+    ).ask()
+
+    if result is None:
+        raise typer.Abort()
+
+    return by_title[result]
+
+
+# =============================================================================
+# Prompt Choices
+# =============================================================================
+# The choice lists are derived from immutable enums, so they are built once
+# on first use. They are cached lazily rather than at import time because the
+# enums live in quickforge.models, which pulls in pydantic.
+
+
+@cache
+def _project_type_choices() -> tuple[tuple[str, ProjectType], ...]:
+    """Return ``(title, value)`` pairs for the project type prompt."""
+    from quickforge.models import ProjectType
+
+    return tuple((f"{pt.value:<10} - {pt.description}", pt) for pt in ProjectType)
+
+
+@cache
+def _python_version_choices() -> tuple[tuple[str, PythonVersion], ...]:
+    """Return ``(title, value)`` pairs for the Python version prompt."""
+    from quickforge.models import PythonVersion
+
+    return tuple((f"Python {pv.value}", pv) for pv in PythonVersion)
+
+
+@cache
+def _license_choices() -> tuple[tuple[str, License], ...]:
+    """Return ``(title, value)`` pairs for the license prompt."""
+    from quickforge.models import License
+
+    return tuple((lic.value, lic) for lic in License)
+
+
+@cache
+def _type_checking_choices() -> tuple[tuple[str, TypeCheckingMode], ...]:
+    """Return ``(title, value)`` pairs for the type checking prompt."""
+    from quickforge.models import TypeCheckingMode
+
+    return (
+        ("standard - Balanced checking (recommended)", TypeCheckingMode.STANDARD),
+        (
+            "strict   - Maximum strictness, requires annotations",
+            TypeCheckingMode.STRICT,
+        ),
+        ("basic    - Minimal checking", TypeCheckingMode.BASIC),
+    )
+
+
+# (title, FeaturesConfig field, checked by default)
+_FEATURE_CHOICES: tuple[tuple[str, str, bool], ...] = (
+    ("GitHub Actions CI/CD", "github_actions", True),
+    ("Pre-commit hooks", "pre_commit", True),
+    ("VS Code settings", "vscode", True),
+    ("Docker configuration", "docker", False),
+    ("Documentation (MkDocs)", "docs", False),
+    ("Dev Container", "devcontainer", False),
+)
+
+
 # =============================================================================
 # Interactive Prompts
 # =============================================================================
@@ -132,24 +437,11 @@ def prompt_project_type() -> ProjectType:
     ProjectType
         The selected project type enum value.
     """
-    choices = [
-        questionary.Choice(
-            title=f"{pt.value:<10} - {pt.description}",
-            value=pt,
-        )
-        for pt in ProjectType
-    ]
-
-    result = questionary.select(
-        "What type of project?",
-        choices=choices,
-        default=ProjectType.LIBRARY,
-    ).ask()
+    from quickforge.models import ProjectType
 
-    if result is None:
-        raise typer.Abort()
-
-    return result
+    return _select(
+        "What type of project?", _project_type_choices(), ProjectType.LIBRARY
+    )
 
 
 def prompt_python_version() -> PythonVersion:
@@ -161,24 +453,11 @@ def prompt_python_version() -> PythonVersion:
     PythonVersion
         The selected Python version.
     """
-    choices = [
-        questionary.Choice(
-            title=f"Python {pv.value}",
-            value=pv,
-        )
-        for pv in PythonVersion
-    ]
-
-    result = questionary.select(
-        "Minimum Python version?",
-        choices=choices,
-        default=PythonVersion.PY312,
-    ).ask()
+    from quickforge.models import PythonVersion
 
-    if result is None:
-        raise typer.Abort()
-
-    return result
+    return _select(
+        "Minimum Python version?", _python_version_choices(), PythonVersion.PY312
+    )
 
 
 def prompt_license() -> License:
@@ -190,63 +469,76 @@ def prompt_license() -> License:
     License
         The selected license.
     """
-    choices = [
-        questionary.Choice(
-            title=lic.value,
-            value=lic,
-        )
-        for lic in License
-    ]
+    from quickforge.models import License
 
-    result = questionary.select(
-        "License?",
-        choices=choices,
-        default=License.MIT,
-    ).ask()
-
-    if result is None:
-        raise typer.Abort()
-
-    return result
+    return _select("License?", _license_choices(), License.MIT)
 
 
-def prompt_author() -> AuthorInfo:
+def _git_identity_defaults() -> tuple[str, str]:
     """
-    Interactively prompt for author information.
+    Read the default author name and email from git config.
 
-    Attempts to read defaults from git config if available.
+    Both keys are fetched with a single ``git config --get-regexp`` call
+    so the interactive path only spawns one git process. stdin is
+    closed so git can never block waiting on the terminal.
 
     Returns
     -------
-    AuthorInfo
-        Author name and optional email.
+    tuple[str, str]
+        ``(name, email)``, falling back to ``("Your Name", "")`` for any
+        key that is not configured or when git is not installed.
     """
     import subprocess
 
-    # Try to get defaults from git config
-    default_name = "Your Name"
-    default_email = ""
+    name = "Your Name"
+    email = ""
 
     try:
         result = subprocess.run(
-            ["git", "config", "user.name"],
+            ["git", "config", "--get-regexp", r"^user\.(name|email)$"],
             check=False,
             capture_output=True,
             text=True,
+            stdin=subprocess.DEVNULL,
         )
-        if result.returncode == 0 and result.stdout.strip():
-            default_name = result.stdout.strip()
-
-        result = subprocess.run(
-            ["git", "config", "user.email"],
-            check=False,
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            default_email = result.stdout.strip()
     except FileNotFoundError:
-        pass  # Git not installed
+        return name, email  # Git not installed
+
+    # --get-regexp exits with 1 when nothing matches; stdout is empty then.
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        value = value.strip()
+        if not value:
+            continue
+        if key == "user.name":
+            name = value
+        elif key == "user.email":
+            email = value
+
+    return name, email
+
+
+def prompt_author() -> AuthorInfo:
+    """
+    Interactively prompt for author information.
+
+    Attempts to read defaults from git config if available.
+
+    Returns
+    -------
+    AuthorInfo
+        Author name and optional email.
+    """
+    from quickforge.models import AuthorInfo
+
+    default_name, default_email = _git_identity_defaults()
+
+    if _use_simple_prompts():
+        name = _simple_text("Author name:", default_name)
+        email = _simple_text("Author email (optional):", default_email)
+        return AuthorInfo(name=name, email=email if email else None)
+
+    import questionary
 
     name = questionary.text(
         "Author name:",
@@ -276,22 +568,25 @@ def prompt_features() -> FeaturesConfig:
     FeaturesConfig
         Configuration of enabled features.
     """
-    features = questionary.checkbox(
-        "Include optional features:",
-        choices=[
-            questionary.Choice(
-                "GitHub Actions CI/CD", value="github_actions", checked=True
-            ),
-            questionary.Choice("Pre-commit hooks", value="pre_commit", checked=True),
-            questionary.Choice("VS Code settings", value="vscode", checked=True),
-            questionary.Choice("Docker configuration", value="docker", checked=False),
-            questionary.Choice("Documentation (MkDocs)", value="docs", checked=False),
-            questionary.Choice("Dev Container", value="devcontainer", checked=False),
-        ],
-    ).ask()
+    from quickforge.models import FeaturesConfig
 
-    if features is None:
-        raise typer.Abort()
+    choices = _FEATURE_CHOICES
+
+    if _use_simple_prompts():
+        features = _simple_checkbox("Include optional features:", choices)
+    else:
+        import questionary
+
+        features = questionary.checkbox(
+            "Include optional features:",
+            choices=[
+                questionary.Choice(title, value=value, checked=checked)
+                for title, value, checked in choices
+            ],
+        ).ask()
+
+        if features is None:
+            raise typer.Abort()
 
     return FeaturesConfig(
         github_actions="github_actions" in features,
@@ -312,6 +607,11 @@ def prompt_description() -> str:
     str
         Project description.
     """
+    if _use_simple_prompts():
+        return _simple_text("Project description:", "A Python project")
+
+    import questionary
+
     result = questionary.text(
         "Project description:",
         default="A Python project",
@@ -332,31 +632,124 @@ def prompt_type_checking_mode() -> TypeCheckingMode:
     TypeCheckingMode
         Selected strictness level.
     """
-    choices = [
-        questionary.Choice(
-            title="standard - Balanced checking (recommended)",
-            value=TypeCheckingMode.STANDARD,
-        ),
-        questionary.Choice(
-            title="strict   - Maximum strictness, requires annotations",
-            value=TypeCheckingMode.STRICT,
-        ),
-        questionary.Choice(
-            title="basic    - Minimal checking",
-            value=TypeCheckingMode.BASIC,
-        ),
-    ]
+    from quickforge.models import TypeCheckingMode
 
-    result = questionary.select(
-        "Type checking strictness?",
-        choices=choices,
-        default=TypeCheckingMode.STANDARD,
-    ).ask()
+    return _select(
+        "Type checking strictness?", _type_checking_choices(), TypeCheckingMode.STANDARD
+    )
 
-    if result is None:
+
+def _confirm_config(config: ProjectConfig) -> None:
+    """
+    Show the resolved configuration and ask the user to confirm it.
+
+    Only used on the interactive path, so ``new --yes`` never builds the
+    summary table. Setting ``QUICKFORGE_QUIET=1`` skips the table and
+    goes straight to the confirmation.
+
+    Parameters
+    ----------
+    config : ProjectConfig
+        The configuration about to be generated.
+
+    Raises
+    ------
+    typer.Abort
+        If the user declines.
+    """
+    if not os.environ.get("QUICKFORGE_QUIET"):
+        from rich.table import Table
+
+        features = ", ".join(config.features.enabled_features) or "none"
+
+        console = _get_console()
+        console.print()
+        table = Table(title="Project Configuration", show_header=False)
+        table.add_column("Setting", style="cyan")
+        table.add_column("Value", style="green")
+
+        table.add_row("Name", config.name)
+        table.add_row("Type", config.project_type.value)
+        table.add_row("Python", config.python_version.value)
+        table.add_row("License", config.license.value)
+        table.add_row("Author", config.author.name)
+        table.add_row("Type Checking", config.tooling.type_checking_mode.value)
+        table.add_row("Features", features)
+
+        console.print(table)
+        console.print()
+
+    if not _confirm("Create project with these settings?"):
         raise typer.Abort()
 
-    return result
+
+# =============================================================================
+# Option Resolution
+# =============================================================================
+
+_E = TypeVar("_E", bound="Enum")
+
+
+def _enum_lookup(enum_cls: type[_E]) -> dict[str, _E]:
+    """
+    Map the case-folded values of ``enum_cls`` to its members.
+
+    Not cached: each option is resolved at most once per process.
+    """
+    return {member.value.casefold(): member for member in enum_cls}
+
+
+@cache
+def _valid_values(enum_cls: type[Enum]) -> str:
+    """Return the comma-separated list of values accepted for ``enum_cls``."""
+    return ", ".join(member.value for member in enum_cls)
+
+
+def _resolve_enum(
+    raw: str | None,
+    enum_cls: type[_E],
+    label: str,
+    *,
+    prompter: Callable[[], _E] | None,
+    default: _E,
+) -> _E:
+    """
+    Resolve an enum-valued command line option.
+
+    Parameters
+    ----------
+    raw : str | None
+        The value given on the command line, if any. Matched
+        case-insensitively against the enum values.
+    enum_cls : type[Enum]
+        The enum the value must belong to.
+    label : str
+        Human-readable option name used in the error message.
+    prompter : Callable[[], Enum] | None
+        Interactive prompt to use when no value was given, or None to
+        fall back to ``default`` without prompting.
+    default : Enum
+        Value used when nothing was given and no prompt is shown.
+
+    Returns
+    -------
+    Enum
+        The resolved enum member.
+
+    Raises
+    ------
+    typer.Exit
+        If ``raw`` is not a valid value of ``enum_cls``.
+    """
+    if raw:
+        member = _enum_lookup(enum_cls).get(raw.casefold())
+        if member is None:
+            _err(f"Invalid {label} '{raw}'. Valid: {_valid_values(enum_cls)}")
+            raise typer.Exit(1)
+        return member
+    if prompter is not None:
+        return prompter()
+    return default
 
 
 # =============================================================================
@@ -562,52 +955,44 @@ def new(
         # API project with Docker
         quickforge new myapi --type api --with-docker
     """
+
+    from quickforge.generator import create_project
+    from quickforge.models import (
+        AuthorInfo,
+        FeaturesConfig,
+        License,
+        ProjectConfig,
+        ProjectType,
+        PythonVersion,
+        ToolingConfig,
+        TypeCheckingMode,
+    )
+
     # Determine if we should prompt for missing values
     should_prompt = interactive or (not yes and project_type is None)
 
-    # Resolve project type
-    resolved_type: ProjectType
-    if project_type:
-        try:
-            resolved_type = ProjectType(project_type.lower())
-        except ValueError:
-            valid = ", ".join(pt.value for pt in ProjectType)
-            rprint(
-                f"[red]Error:[/] Invalid project type '{project_type}'. Valid: {valid}"
-            )
-            raise typer.Exit(1) from None
-    elif should_prompt:
-        resolved_type = prompt_project_type()
-    else:
-        resolved_type = ProjectType.LIBRARY
-
-    # Resolve Python version
-    resolved_python: PythonVersion
-    if python:
-        try:
-            resolved_python = PythonVersion(python)
-        except ValueError:
-            valid = ", ".join(pv.value for pv in PythonVersion)
-            rprint(f"[red]Error:[/] Invalid Python version '{python}'. Valid: {valid}")
-            raise typer.Exit(1) from None
-    elif should_prompt:
-        resolved_python = prompt_python_version()
-    else:
-        resolved_python = PythonVersion.PY312
-
-    # Resolve license
-    resolved_license: License
-    if license_:
-        try:
-            resolved_license = License(license_)
-        except ValueError:
-            valid = ", ".join(lic.value for lic in License)
-            rprint(f"[red]Error:[/] Invalid license '{license_}'. Valid: {valid}")
-            raise typer.Exit(1) from None
-    elif should_prompt:
-        resolved_license = prompt_license()
-    else:
-        resolved_license = License.MIT
+    # Resolve project type, Python version and license
+    resolved_type = _resolve_enum(
+        project_type,
+        ProjectType,
+        "project type",
+        prompter=prompt_project_type if should_prompt else None,
+        default=ProjectType.LIBRARY,
+    )
+    resolved_python = _resolve_enum(
+        python,
+        PythonVersion,
+        "Python version",
+        prompter=prompt_python_version if should_prompt else None,
+        default=PythonVersion.PY312,
+    )
+    resolved_license = _resolve_enum(
+        license_,
+        License,
+        "license",
+        prompter=prompt_license if should_prompt else None,
+        default=License.MIT,
+    )
 
     # Resolve author
     resolved_author: AuthorInfo
@@ -666,31 +1051,12 @@ def new(
             output_dir=output_dir or Path.cwd(),
         )
     except ValueError as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
 
     # Show configuration summary if in interactive mode
     if should_prompt and not yes:
-        console.print()
-        table = Table(title="Project Configuration", show_header=False)
-        table.add_column("Setting", style="cyan")
-        table.add_column("Value", style="green")
-
-        table.add_row("Name", config.name)
-        table.add_row("Type", config.project_type.value)
-        table.add_row("Python", config.python_version.value)
-        table.add_row("License", config.license.value)
-        table.add_row("Author", config.author.name)
-        table.add_row("Type Checking", config.tooling.type_checking_mode.value)
-        table.add_row("Features", ", ".join(config.features.enabled_features) or "none")
-
-        console.print(table)
-        console.print()
-
-        if not questionary.confirm(
-            "Create project with these settings?", default=True
-        ).ask():
-            raise typer.Abort()
+        _confirm_config(config)
 
     # Create the project
     try:
@@ -707,7 +1073,7 @@ def new(
     except FileExistsError:
         raise typer.Exit(1) from None
     except Exception as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
 
 
@@ -715,6 +1081,75 @@ def new(
 # Audit Command (Phase 3 - Placeholder)
 # =============================================================================
 
+# Display style and sort rank per Severity. Keyed by the plain values (the
+# enum is a str subclass, so members hash and compare equal to them), which
+# keeps quickforge.auditor out of the CLI import.
+_SEVERITY_STYLES = MappingProxyType(
+    {
+        "critical": "red",
+        "error": "red",
+        "warning": "yellow",
+        "info": "blue",
+    }
+)
+_SEVERITY_RANK = MappingProxyType({"critical": 0, "error": 1, "warning": 2, "info": 3})
+
+# Above this many recommendations the audit prints one line per finding
+# instead of a Table, whose layout pass measures every cell.
+_MAX_TABLE_RECOMMENDATIONS = 50
+
+# Display names for the keys of AuditResult.tooling_detected
+_TOOL_NAMES = MappingProxyType(
+    {
+        "package_manager": "Package Manager",
+        "linter": "Linter",
+        "formatter": "Formatter",
+        "import_sorter": "Import Sorter",
+        "type_checker": "Type Checker",
+        "pre_commit": "Pre-commit",
+        "ci": "CI/CD",
+        "type_coverage": "Type Coverage",
+        "status": "Status",
+    }
+)
+
+
+def _print_recommendation_lines(recommendations: list[Recommendation]) -> None:
+    """
+    Print audit recommendations as fixed-width lines.
+
+    Used instead of the Recommendations table for large audits: each
+    line is assembled directly, so rich never has to lay out (and
+    measure) the whole table.
+
+    Parameters
+    ----------
+    recommendations : list[Recommendation]
+        The recommendations to print, in any order.
+    """
+    from rich.text import Text
+
+    from quickforge.auditor import AuditCategory
+
+    console = _get_console()
+    severity_width = max(len(value) for value in _SEVERITY_RANK)
+    category_labels = {c: c.value.replace("_", " ") for c in AuditCategory}
+    category_width = max(len(label) for label in category_labels.values())
+
+    console.print("[bold]Recommendations[/]")
+    for rec in sorted(recommendations, key=lambda r: _SEVERITY_RANK[r.severity]):
+        line = Text.assemble(
+            (
+                f"{rec.severity.value:<{severity_width}}  ",
+                f"bold {_SEVERITY_STYLES[rec.severity]}",
+            ),
+            (f"{category_labels[rec.category]:<{category_width}}  ", "cyan"),
+            rec.message,
+        )
+        if rec.action:
+            line.append(f"  ({rec.action})", style="dim")
+        console.print(line)
+
 
 @app.command()
 def audit(
@@ -727,6 +1162,14 @@ def audit(
             dir_okay=True,
         ),
     ] = Path(),
+    quiet: Annotated[
+        bool,
+        typer.Option(
+            "--quiet",
+            "-q",
+            help="Print only the score and recommendation counts as plain text",
+        ),
+    ] = False,
 ) -> None:
     """
     Audit an existing project for improvements.
@@ -741,17 +1184,34 @@ def audit(
     [bold]Example:[/]
 
         quickforge audit ./myproject
-        quickforge audit .
+        quickforge audit . --quiet
     """
+    from quickforge.auditor import AuditCategory, audit_project
+
     try:
         result = audit_project(path)
     except FileNotFoundError as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
     except NotADirectoryError as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
 
+    if quiet:
+        typer.echo(
+            f"{result.project_path}\n"
+            f"score: {result.score}/100\n"
+            f"recommendations: {len(result.recommendations)} "
+            f"({result.critical_count} critical, {result.error_count} errors, "
+            f"{result.warning_count} warnings, {result.info_count} info)"
+        )
+        return
+
+    from rich.panel import Panel
+    from rich.table import Table
+
+    console = _get_console()
+
     # Display project path
     console.print()
     console.print(f"[bold]Auditing:[/] {result.project_path}")
@@ -763,20 +1223,8 @@ def audit(
         tooling_table.add_column("Category", style="cyan")
         tooling_table.add_column("Tool", style="green")
 
-        tool_names = {
-            "package_manager": "Package Manager",
-            "linter": "Linter",
-            "formatter": "Formatter",
-            "import_sorter": "Import Sorter",
-            "type_checker": "Type Checker",
-            "pre_commit": "Pre-commit",
-            "ci": "CI/CD",
-            "type_coverage": "Type Coverage",
-            "status": "Status",
-        }
-
         for key, value in result.tooling_detected.items():
-            display_name = tool_names.get(key, key)
+            display_name = _TOOL_NAMES.get(key, key)
             if value == "modern":
                 tooling_table.add_row(display_name, f"[bold green]{value}[/]")
             else:
@@ -799,7 +1247,9 @@ def audit(
     console.print()
 
     # Display recommendations
-    if result.recommendations:
+    if len(result.recommendations) > _MAX_TABLE_RECOMMENDATIONS:
+        _print_recommendation_lines(result.recommendations)
+    elif result.recommendations:
         rec_table = Table(title="Recommendations", show_header=True)
         rec_table.add_column("Severity", style="bold", width=10)
         rec_table.add_column("Category", style="cyan", width=15)
@@ -807,28 +1257,15 @@ def audit(
         rec_table.add_column("Action", style="dim")
 
         # Sort by severity (critical first)
-        severity_order = {
-            Severity.CRITICAL: 0,
-            Severity.ERROR: 1,
-            Severity.WARNING: 2,
-            Severity.INFO: 3,
-        }
         sorted_recs = sorted(
-            result.recommendations, key=lambda r: severity_order[r.severity]
+            result.recommendations, key=lambda r: _SEVERITY_RANK[r.severity]
         )
+        category_labels = {c: c.value.replace("_", " ") for c in AuditCategory}
 
         for rec in sorted_recs:
-            severity_colors = {
-                Severity.CRITICAL: "red",
-                Severity.ERROR: "red",
-                Severity.WARNING: "yellow",
-                Severity.INFO: "blue",
-            }
-            severity_style = severity_colors.get(rec.severity, "white")
-
             rec_table.add_row(
-                f"[{severity_style}]{rec.severity.value}[/]",
-                rec.category.value.replace("_", " "),
+                f"[{_SEVERITY_STYLES[rec.severity]}]{rec.severity.value}[/]",
+                category_labels[rec.category],
                 rec.message,
                 rec.action or "",
             )
@@ -866,6 +1303,9 @@ def audit(
 # Upgrade Command (Phase 3 - Placeholder)
 # =============================================================================
 
+_CHECK_PREFIX = "✓ "
+_CROSS_PREFIX = "✗ "
+
 
 @app.command()
 def upgrade(
@@ -924,6 +1364,13 @@ def upgrade(
         quickforge upgrade . --from poetry
         quickforge upgrade ./myproject --dry-run
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from quickforge.upgrader import create_migration_plan, upgrade_project
+
+    console = _get_console()
+
     console.print()
 
     if dry_run:
@@ -952,13 +1399,17 @@ def upgrade(
     plan_table.add_column("Migration", width=40)
     plan_table.add_column("From → To", style="green")
 
-    for i, step in enumerate(steps, 1):
-        plan_table.add_row(
+    rows = [
+        (
             str(i),
-            step.migration_type.value.replace("_", " "),
+            step.migration_type.display_label,
             step.description,
             f"{step.source} → {step.target}",
         )
+        for i, step in enumerate(steps, 1)
+    ]
+    for row in rows:
+        plan_table.add_row(*row)
 
     console.print(plan_table)
     console.print()
@@ -968,13 +1419,7 @@ def upgrade(
         return
 
     # Confirm before proceeding
-    if (
-        not yes
-        and not questionary.confirm(
-            "Proceed with migration?",
-            default=True,
-        ).ask()
-    ):
+    if not yes and not _confirm("Proceed with migration?"):
         raise typer.Abort()
 
     console.print()
@@ -985,6 +1430,7 @@ def upgrade(
         from_tool=from_tool,
         dry_run=False,
         backup=not no_backup,
+        steps=steps,
     )
 
     # Display results
@@ -997,7 +1443,7 @@ def upgrade(
         changes_table.add_column("Change", style="green")
 
         for change in result.changes_made:
-            changes_table.add_row(f"✓ {change}")
+            changes_table.add_row(_CHECK_PREFIX + change)
 
         console.print(changes_table)
         console.print()
@@ -1007,7 +1453,7 @@ def upgrade(
         error_table.add_column("Error", style="red")
 
         for error in result.errors:
-            error_table.add_row(f"✗ {error}")
+            error_table.add_row(_CROSS_PREFIX + error)
 
         console.print(error_table)
         console.print()
@@ -1040,6 +1486,11 @@ def upgrade(
 # Add Command (Phase 3 - Placeholder)
 # =============================================================================
 
+# Status column markup for the "Files to Create" table
+_STATUS_CREATE = "[green]will create[/]"
+_STATUS_OVERWRITE = "[yellow]will overwrite[/]"
+_STATUS_EXISTS = "[red]exists (use --force)[/]"
+
 
 @app.command()
 def add(
@@ -1087,11 +1538,21 @@ def add(
         quickforge add docker --path ./myproject
         quickforge add docs --force
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from quickforge.generator import (
+        FEATURE_TEMPLATES,
+        add_feature_to_project,
+        find_existing_outputs,
+    )
+
+    console = _get_console()
+
     # Validate feature
     if feature not in FEATURE_TEMPLATES:
         valid = ", ".join(FEATURE_TEMPLATES.keys())
-        rprint(f"[red]Error:[/] Unknown feature '{feature}'")
-        rprint(f"[dim]Valid features: {valid}[/]")
+        _err(f"Unknown feature '{feature}'", hint=f"Valid features: {valid}")
         raise typer.Exit(1)
 
     # Resolve path early to avoid /tmp vs /private/tmp issues on macOS
@@ -1099,8 +1560,10 @@ def add(
 
     # Check for pyproject.toml
     if not (path / "pyproject.toml").exists():
-        rprint(f"[red]Error:[/] No pyproject.toml found at {path}")
-        rprint("[dim]Run 'quickforge new' to create a new project first.[/]")
+        _err(
+            f"No pyproject.toml found at {path}",
+            hint="Run 'quickforge new' to create a new project first.",
+        )
         raise typer.Exit(1)
 
     console.print()
@@ -1113,15 +1576,13 @@ def add(
     files_table.add_column("File", style="cyan")
     files_table.add_column("Status", style="dim")
 
+    existing = find_existing_outputs(path, (output for _, output in templates))
     for _, output_path in templates:
-        full_path = path / output_path
-        if full_path.exists():
-            if force:
-                files_table.add_row(output_path, "[yellow]will overwrite[/]")
-            else:
-                files_table.add_row(output_path, "[red]exists (use --force)[/]")
+        if output_path in existing:
+            status = _STATUS_OVERWRITE if force else _STATUS_EXISTS
         else:
-            files_table.add_row(output_path, "[green]will create[/]")
+            status = _STATUS_CREATE
+        files_table.add_row(output_path, status)
 
     console.print(files_table)
     console.print()
@@ -1163,13 +1624,13 @@ def add(
             console.print("  git commit -m 'Add GitHub Actions CI'")
 
     except FileExistsError as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
     except FileNotFoundError as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
     except Exception as e:
-        rprint(f"[red]Error:[/] {e}")
+        _err(str(e))
         raise typer.Exit(1) from None
 
 
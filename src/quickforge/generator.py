@@ -58,17 +58,21 @@ See Also
 
 from __future__ import annotations
 
+import ast
 import os
 import re
 import shutil
 import subprocess
+from contextlib import suppress
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from functools import cache
+from itertools import chain
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from jinja2 import Environment, PackageLoader, select_autoescape
-from rich.console import Console
+from jinja2 import Environment, PackageLoader, Template, select_autoescape
+from rich.console import Console, Group
 from rich.panel import Panel
 
 from quickforge import __version__
@@ -84,8 +88,13 @@ from quickforge.models import (
 )
 
 
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore[import-not-found]
+
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Iterable
 
     from rich.progress import Progress
 
@@ -97,9 +106,10 @@ if TYPE_CHECKING:
 # Console for rich output
 console = Console()
 
-# Template file mappings: template_name -> (output_path, condition_func)
-# The condition_func determines if the template should be rendered
-TEMPLATE_MAPPINGS: dict[str, tuple[str, Callable[[ProjectConfig], bool] | None]] = {
+# Template file mappings: template_name -> (output_path, condition)
+# The condition names a flag from _template_flags() that must be set for the
+# template to be rendered; None means always render.
+TEMPLATE_MAPPINGS: dict[str, tuple[str, str | None]] = {
     # Core files (always generated)
     "pyproject.toml.j2": ("pyproject.toml", None),
     "README.md.j2": ("README.md", None),
@@ -107,30 +117,22 @@ TEMPLATE_MAPPINGS: dict[str, tuple[str, Callable[[ProjectConfig], bool] | None]]
     # Package files
     "package_init.py.j2": ("{src_path}/__init__.py", None),
     # Conditional files based on project type
-    "cli.py.j2": ("{src_path}/cli.py", lambda c: c.project_type == ProjectType.CLI),
-    "main.py.j2": (
-        "{src_path}/main.py",
-        lambda c: c.project_type in {ProjectType.APP, ProjectType.API},
-    ),
+    "cli.py.j2": ("{src_path}/cli.py", "cli"),
+    "main.py.j2": ("{src_path}/main.py", "app_or_api"),
     # Test files
     "test_main.py.j2": ("tests/test_main.py", None),
     # Feature-based files
-    "pre-commit-config.yaml.j2": (
-        ".pre-commit-config.yaml",
-        lambda c: c.features.pre_commit,
-    ),
-    "github_ci.yml.j2": (
-        ".github/workflows/ci.yml",
-        lambda c: c.features.github_actions,
-    ),
-    "vscode_settings.json.j2": (
-        ".vscode/settings.json",
-        lambda c: c.features.vscode,
-    ),
-    "vscode_extensions.json.j2": (
-        ".vscode/extensions.json",
-        lambda c: c.features.vscode,
-    ),
+    "pre-commit-config.yaml.j2": (".pre-commit-config.yaml", "pre_commit"),
+    "github_ci.yml.j2": (".github/workflows/ci.yml", "github_actions"),
+    "vscode_settings.json.j2": (".vscode/settings.json", "vscode"),
+    "vscode_extensions.json.j2": (".vscode/extensions.json", "vscode"),
+}
+
+# Output paths of the templates whose pattern has no placeholders
+_STATIC_OUTPUT_PATHS: dict[str, Path] = {
+    template_name: Path(output_pattern)
+    for template_name, (output_pattern, _) in TEMPLATE_MAPPINGS.items()
+    if "{" not in output_pattern
 }
 
 # License template mappings - every License the CLI offers must map to a
@@ -150,7 +152,7 @@ LICENSE_TEMPLATES: dict[License, str] = {
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """
     Result of a project generation operation.
@@ -232,7 +234,7 @@ def create_jinja_env() -> Environment:
     )
 
     # Add custom filters
-    env.filters["snake_case"] = lambda s: s.replace("-", "_").lower()
+    env.filters["snake_case"] = _snake_case
 
     # Escaping filters for embedding free-text (description, author name) into
     # generated files. Autoescaping is disabled for code generation, so every
@@ -246,6 +248,71 @@ def create_jinja_env() -> Environment:
     return env
 
 
+@cache
+def _get_env() -> Environment:
+    """Return the process-wide environment used for project generation."""
+    return create_jinja_env()
+
+
+@cache
+def _get_template(template_name: str) -> Template:
+    """
+    Load a template from the shared environment.
+
+    Templates ship inside the package and do not change while quickforge
+    runs, so each one is looked up and compiled at most once per process
+    (skipping Jinja's per-lookup up-to-date check as well).
+    """
+    return _get_env().get_template(template_name)
+
+
+@cache
+def _available_templates() -> frozenset[str]:
+    """Names of all templates shipped with the package, listed once."""
+    return frozenset(_get_env().list_templates())
+
+
+def _template_flags(config: ProjectConfig) -> dict[str, bool]:
+    """Evaluate every TEMPLATE_MAPPINGS condition for ``config`` at once."""
+    return {
+        "cli": config.project_type == ProjectType.CLI,
+        "app_or_api": config.project_type in {ProjectType.APP, ProjectType.API},
+        "pre_commit": config.features.pre_commit,
+        "github_actions": config.features.github_actions,
+        "vscode": config.features.vscode,
+    }
+
+
+def _template_context(config: ProjectConfig) -> dict[str, object]:
+    """
+    Build the context passed to every template.
+
+    The template context includes:
+    - config: The full ProjectConfig object
+    - quickforge_version: For attribution in generated files
+    - year: Current year for license files
+    """
+    return {
+        "config": config,
+        "quickforge_version": __version__,
+        "year": datetime.now(UTC).year,
+    }
+
+
+# Lowercases ASCII letters and turns hyphens into underscores in one pass
+_SNAKE_CASE_TABLE = str.maketrans(
+    "-ABCDEFGHIJKLMNOPQRSTUVWXYZ", "_abcdefghijklmnopqrstuvwxyz"
+)
+
+
+def _snake_case(value: str) -> str:
+    """Convert a hyphenated name to snake_case (``My-App`` -> ``my_app``)."""
+    if value.isascii():
+        return value.translate(_SNAKE_CASE_TABLE)
+    # The table only covers ASCII; other scripts need full case mapping
+    return value.replace("-", "_").lower()
+
+
 def _github_slug(value: object) -> str:
     """
     Turn an author name into a URL-safe slug for GitHub URLs.
@@ -332,48 +399,33 @@ def create_directory_structure(config: ProjectConfig) -> list[Path]:
         └── ...
     """
     project_dir = config.project_dir
-    created_dirs: list[Path] = []
 
-    # Check if project directory already exists
-    if project_dir.exists():
+    # Create project root; mkdir itself reports an existing directory
+    try:
+        project_dir.mkdir(parents=True)
+    except FileExistsError:
         raise FileExistsError(
             f"Directory '{project_dir}' already exists. "
             "Use a different name or remove the existing directory."
-        )
-
-    # Create project root
-    project_dir.mkdir(parents=True)
-    created_dirs.append(project_dir)
+        ) from None
 
-    # Create source directory based on layout
-    src_path = project_dir / config.get_src_path()
-    src_path.mkdir(parents=True)
-    created_dirs.append(src_path)
+    # Source directory (depends on layout) and tests directory
+    subdirs = [config.get_src_path(), config.get_test_path()]
 
-    # Create tests directory
-    tests_path = project_dir / config.get_test_path()
-    tests_path.mkdir(parents=True)
-    created_dirs.append(tests_path)
-
-    # Create optional directories based on features
+    # Optional directories based on features. Docker files go in the
+    # project root, so no separate dir is needed.
     if config.features.github_actions:
-        github_dir = project_dir / ".github" / "workflows"
-        github_dir.mkdir(parents=True)
-        created_dirs.append(github_dir)
-
+        subdirs.append(Path(".github", "workflows"))
     if config.features.vscode:
-        vscode_dir = project_dir / ".vscode"
-        vscode_dir.mkdir(parents=True)
-        created_dirs.append(vscode_dir)
-
+        subdirs.append(Path(".vscode"))
     if config.features.docs:
-        docs_dir = project_dir / "docs"
-        docs_dir.mkdir(parents=True)
-        created_dirs.append(docs_dir)
+        subdirs.append(Path("docs"))
 
-    if config.features.docker:
-        # Docker files go in project root, no separate dir needed
-        pass
+    created_dirs = [project_dir]
+    for subdir in subdirs:
+        directory = project_dir / subdir
+        directory.mkdir(parents=True)
+        created_dirs.append(directory)
 
     return created_dirs
 
@@ -416,21 +468,10 @@ def render_template(
 
     Notes
     -----
-    The template context includes:
-    - config: The full ProjectConfig object
-    - quickforge_version: For attribution in generated files
-    - year: Current year for license files
+    See `_template_context` for the variables available to templates.
     """
     template = env.get_template(template_name)
-
-    # Build template context
-    context = {
-        "config": config,
-        "quickforge_version": __version__,
-        "year": datetime.now(UTC).year,
-    }
-
-    return template.render(**context)
+    return template.render(_template_context(config))
 
 
 def get_output_path(
@@ -462,15 +503,23 @@ def get_output_path(
     >>> get_output_path("{src_path}/__init__.py", config)
     PosixPath('src/mylib/__init__.py')
     """
-    # Resolve placeholders segment-by-segment using pathlib joins rather than
-    # string formatting. Formatting a Path via str() can mix separators on
-    # Windows; joining keeps the result platform-correct.
-    replacements: dict[str, Path] = {
+    return _resolve_output_path(template_path, _path_replacements(config))
+
+
+def _path_replacements(config: ProjectConfig) -> dict[str, Path]:
+    """Map each output path placeholder to its value for ``config``."""
+    return {
         "{src_path}": config.get_src_path(),
         "{test_path}": config.get_test_path(),
         "{package_name}": Path(config.package_name),
     }
 
+
+def _resolve_output_path(template_path: str, replacements: dict[str, Path]) -> Path:
+    """Resolve an output path pattern against precomputed replacements."""
+    # Resolve placeholders segment-by-segment using pathlib joins rather than
+    # string formatting. Formatting a Path via str() can mix separators on
+    # Windows; joining keeps the result platform-correct.
     result = Path()
     for segment in template_path.split("/"):
         result = result / replacements.get(segment, Path(segment))
@@ -504,41 +553,46 @@ def render_all_templates(
     Notes
     -----
     Templates are skipped if:
-    - Their condition function returns False
+    - Their condition evaluates to False
     - The template file doesn't exist (logged as warning)
+
+    Errors raised while rendering an existing template propagate; they are
+    bugs in the template rather than something to skip over.
     """
-    env = create_jinja_env()
+    context = _template_context(config)
+    flags = _template_flags(config)
+    replacements = _path_replacements(config)
+    available = _available_templates()
     rendered: dict[Path, str] = {}
 
     for template_name, (output_pattern, condition) in TEMPLATE_MAPPINGS.items():
         # Check if this template should be rendered
-        if condition is not None and not condition(config):
+        if condition is not None and not flags[condition]:
             continue
 
         # Update progress if provided
         if progress:
             progress.console.print(f"  Rendering {template_name}...")
 
-        try:
-            # Render the template
-            content = render_template(env, template_name, config)
-
-            # Get the output path
-            output_path = get_output_path(output_pattern, config)
+        if template_name not in available:
+            console.print(f"[yellow]Warning: Template not found: {template_name}[/]")
+            continue
 
-            rendered[output_path] = content
+        # Get the output path
+        output_path = _STATIC_OUTPUT_PATHS.get(template_name)
+        if output_path is None:
+            output_path = _resolve_output_path(output_pattern, replacements)
 
-        except Exception as e:
-            console.print(f"[yellow]Warning: Failed to render {template_name}: {e}[/]")
+        rendered[output_path] = _get_template(template_name).render(context)
 
     # Handle license file separately (different template based on license type)
     license_template = LICENSE_TEMPLATES.get(config.license)
     if license_template:
-        try:
-            content = render_template(env, license_template, config)
+        if license_template in available:
+            content = _get_template(license_template).render(context)
             rendered[Path("LICENSE")] = content
-        except Exception as e:
-            console.print(f"[yellow]Warning: Failed to render LICENSE: {e}[/]")
+        else:
+            console.print(f"[yellow]Warning: Template not found: {license_template}[/]")
 
     return rendered
 
@@ -548,6 +602,34 @@ def render_all_templates(
 # =============================================================================
 
 
+def _make_parent_dirs(paths: Iterable[Path]) -> None:
+    """
+    Ensure the parent directory of every path exists.
+
+    Each directory is created once rather than once per file, shallowest
+    first so that every mkdir is a single call.
+    """
+    parents = {full_path.parent for full_path in paths}
+    for parent in sorted(parents, key=lambda p: len(p.parts)):
+        parent.mkdir(parents=True, exist_ok=True)
+
+
+def _missing_dirs(root: Path, paths: Iterable[Path]) -> list[Path]:
+    """
+    Return the directories below ``root`` that the given paths still need.
+
+    The result is ordered deepest first, so that removing the directories
+    in order (after a failed write) empties each one before its parent.
+    """
+    missing: set[Path] = set()
+    for full_path in paths:
+        for parent in full_path.parents:
+            if parent == root or parent in missing or parent.is_dir():
+                break
+            missing.add(parent)
+    return sorted(missing, key=lambda p: len(p.parts), reverse=True)
+
+
 def write_files(
     project_dir: Path,
     files: dict[Path, str],
@@ -579,14 +661,14 @@ def write_files(
     """
     created_files: list[Path] = []
 
+    _make_parent_dirs(project_dir / relative_path for relative_path in files)
+
     for relative_path, content in files.items():
         full_path = project_dir / relative_path
 
-        # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
-
-        # Write the file
-        full_path.write_text(content, encoding="utf-8")
+        # Write the file as UTF-8 bytes: skips the text-layer wrapper and
+        # keeps the templates' LF line endings on every platform
+        full_path.write_bytes(content.encode())
         created_files.append(full_path)
 
         if progress:
@@ -595,45 +677,9 @@ def write_files(
     return created_files
 
 
-def create_py_typed(config: ProjectConfig) -> None:
-    """
-    Create the py.typed marker file for PEP 561 compliance.
-
-    This marker file indicates that the package supports type checking
-    and includes inline type annotations or stub files.
-
-    Parameters
-    ----------
-    config : ProjectConfig
-        Project configuration.
-
-    Notes
-    -----
-    PEP 561 (https://peps.python.org/pep-0561/) defines how packages
-    can indicate they support type checking. The py.typed file is an
-    empty marker that type checkers look for.
-    """
-    py_typed_path = config.project_dir / config.get_src_path() / "py.typed"
-    py_typed_path.touch()
-
-
-def create_test_init(config: ProjectConfig) -> None:
-    """
-    Create an empty __init__.py in the tests directory.
-
-    This file is required for pytest to properly discover tests
-    in the tests/ directory when using src layout.
-
-    Parameters
-    ----------
-    config : ProjectConfig
-        Project configuration.
-    """
-    test_init_path = config.project_dir / config.get_test_path() / "__init__.py"
-    test_init_path.write_text(
-        f'"""Tests for the {config.name} package."""\n',
-        encoding="utf-8",
-    )
+def _test_init_content(config: ProjectConfig) -> str:
+    """Content of the generated tests/__init__.py."""
+    return f'"""Tests for the {config.name} package."""\n'
 
 
 # =============================================================================
@@ -664,29 +710,22 @@ def init_git_repository(project_dir: Path) -> bool:
     returns False but does not raise an exception. The project
     is still usable without git.
     """
-    try:
-        # Check if git is available
-        subprocess.run(
-            ["git", "--version"],
-            capture_output=True,
-            check=True,
-        )
+    # Output is discarded, so don't capture it; stdin is closed so git can
+    # never block waiting for input (e.g. a credential or editor prompt).
+    quiet = {
+        "cwd": project_dir,
+        "stdin": subprocess.DEVNULL,
+        "stdout": subprocess.DEVNULL,
+        "stderr": subprocess.DEVNULL,
+    }
 
-        # Initialize repository
-        subprocess.run(
-            ["git", "init"],
-            cwd=project_dir,
-            capture_output=True,
-            check=True,
-        )
+    try:
+        # Initialize repository. A missing git binary raises
+        # FileNotFoundError here, so no separate `git --version` probe.
+        subprocess.run(["git", "init", "-q"], check=True, **quiet)
 
         # Add all files
-        subprocess.run(
-            ["git", "add", "."],
-            cwd=project_dir,
-            capture_output=True,
-            check=True,
-        )
+        subprocess.run(["git", "add", "."], check=True, **quiet)
 
         # Only inject a placeholder identity when the user has none configured;
         # otherwise the user's real git identity should author their own
@@ -703,11 +742,10 @@ def init_git_repository(project_dir: Path) -> bool:
 
         # Create initial commit
         subprocess.run(
-            ["git", "commit", "-m", "Initial commit (generated by quickforge)"],
-            cwd=project_dir,
-            capture_output=True,
+            ["git", "commit", "-q", "-m", "Initial commit (generated by quickforge)"],
             check=True,
             env=commit_env,
+            **quiet,
         )
 
         return True
@@ -750,6 +788,15 @@ def _has_git_identity(project_dir: Path) -> bool:
 # =============================================================================
 
 
+# Files every generated project has, relative to the project root
+_STATIC_ESSENTIAL_FILES = (
+    Path("pyproject.toml"),
+    Path("README.md"),
+    Path(".gitignore"),
+)
+_TEST_ESSENTIAL_FILES = (Path("tests") / "__init__.py",)
+
+
 def validate_project(config: ProjectConfig) -> tuple[bool, list[str]]:
     """
     Validate that the generated project is correctly set up.
@@ -772,50 +819,93 @@ def validate_project(config: ProjectConfig) -> tuple[bool, list[str]]:
     ----------------
     1. All expected files exist
     2. pyproject.toml is valid TOML
-    3. Package __init__.py is importable syntax
+    3. Python files parse without syntax errors
     4. .gitignore exists and has content
     """
     issues: list[str] = []
     project_dir = config.project_dir
 
-    # Check essential files exist
-    essential_files = [
-        "pyproject.toml",
-        "README.md",
-        ".gitignore",
-        config.get_src_path() / "__init__.py",
-        config.get_src_path() / "py.typed",
-        config.get_test_path() / "__init__.py",
-    ]
-
-    for file_path in essential_files:
-        full_path = project_dir / file_path
-        if not full_path.exists():
-            issues.append(f"Missing essential file: {file_path}")
+    # List the project tree once; the checks below only do lookups in it
+    files, python_files = _scan_project(project_dir)
+
+    # Check essential files exist (only the package paths vary per project)
+    src_path = config.src_path
+    essential_files = chain(
+        _STATIC_ESSENTIAL_FILES,
+        (src_path / "__init__.py", src_path / "py.typed"),
+        _TEST_ESSENTIAL_FILES,
+    )
+    issues.extend(
+        f"Missing essential file: {file_path}"
+        for file_path in essential_files
+        if file_path not in files
+    )
 
     # Validate pyproject.toml is valid TOML
     pyproject_path = project_dir / "pyproject.toml"
-    if pyproject_path.exists():
+    if Path("pyproject.toml") in files:
         try:
-            import tomli
-
             with pyproject_path.open("rb") as f:
-                tomli.load(f)
-        except Exception as e:
+                tomllib.load(f)
+        except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
             issues.append(f"Invalid pyproject.toml: {e}")
 
     # Check Python syntax of generated files
-    python_files = list(project_dir.rglob("*.py"))
     for py_file in python_files:
-        try:
-            content = py_file.read_text(encoding="utf-8")
-            compile(content, py_file, "exec")
-        except SyntaxError as e:
-            issues.append(f"Syntax error in {py_file.relative_to(project_dir)}: {e}")
+        error = _check_syntax(py_file)
+        if error is not None:
+            issues.append(
+                f"Syntax error in {py_file.relative_to(project_dir)}: {error}"
+            )
 
     return len(issues) == 0, issues
 
 
+def _scan_project(project_dir: Path) -> tuple[set[Path], list[Path]]:
+    """
+    Walk a project tree once with os.scandir.
+
+    Returns
+    -------
+    tuple[set[Path], list[Path]]
+        The paths of all files relative to ``project_dir``, and the full
+        paths of the ``.py`` files among them. Symlinked directories are
+        not followed.
+    """
+    files: set[Path] = set()
+    python_files: list[Path] = []
+    stack = [(project_dir, Path())]
+    while stack:
+        directory, relative = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((directory / entry.name, relative / entry.name))
+                        continue
+                    files.add(relative / entry.name)
+                    if entry.name.endswith(".py"):
+                        python_files.append(directory / entry.name)
+        except OSError:
+            continue
+    return files, python_files
+
+
+def _check_syntax(py_file: Path) -> str | None:
+    """
+    Parse one Python file and return its syntax error, if any.
+
+    Only the parser runs: no bytecode is generated just to be discarded.
+    The raw bytes are parsed directly (ast.parse honours PEP 263 coding
+    declarations itself).
+    """
+    try:
+        ast.parse(py_file.read_bytes(), filename=py_file)
+    except SyntaxError as e:
+        return str(e)
+    return None
+
+
 # =============================================================================
 # Main Generation Function
 # =============================================================================
@@ -887,66 +977,65 @@ def create_project(
     )
 
     try:
-        # Display header
+        # Display header (together with the first step heading). Status
+        # output is printed once per step rather than once per line.
         if verbose:
-            console.print()
             console.print(
-                Panel(
-                    f"[bold blue]Creating project:[/] [green]{config.name}[/]\n"
-                    f"[dim]Type: {config.project_type.value} | "
-                    f"Python: {config.python_version.value} | "
-                    f"License: {config.license.value}[/]",
-                    title="[bold]quickforge[/]",
-                    border_style="blue",
+                Group(
+                    "",
+                    Panel(
+                        f"[bold blue]Creating project:[/] [green]{config.name}[/]\n"
+                        f"[dim]Type: {config.project_type.value} | "
+                        f"Python: {config.python_version.value} | "
+                        f"License: {config.license.value}[/]",
+                        title="[bold]quickforge[/]",
+                        border_style="blue",
+                    ),
+                    "",
+                    "[bold]📁 Creating directory structure...[/]",
                 )
             )
-            console.print()
 
         # Step 1: Create directory structure
-        if verbose:
-            console.print("[bold]📁 Creating directory structure...[/]")
-
         created_dirs = create_directory_structure(config)
 
         if verbose:
-            for d in created_dirs:
-                console.print(f"  Created {d.relative_to(config.output_dir)}/")
+            console.print(
+                "\n".join(
+                    f"  Created {d.relative_to(config.output_dir)}/"
+                    for d in created_dirs
+                )
+            )
 
         # Step 2: Render templates
         if verbose:
-            console.print()
-            console.print("[bold]📝 Rendering templates...[/]")
+            console.print("\n[bold]📝 Rendering templates...[/]")
 
         rendered_files = render_all_templates(config)
 
+        # Additional files (the py.typed marker and tests/__init__.py) are
+        # written in the same batch as the rendered templates
+        src_path = config.src_path
+        test_path = config.get_test_path()
+        rendered_files[src_path / "py.typed"] = ""
+        rendered_files[test_path / "__init__.py"] = _test_init_content(config)
+
         # Step 3: Write files
         if verbose:
-            console.print()
-            console.print("[bold]💾 Writing files...[/]")
+            console.print("\n[bold]💾 Writing files...[/]")
 
         written_files = write_files(config.project_dir, rendered_files)
         result.files_created.extend(written_files)
 
-        # Step 4: Create additional files
-        create_py_typed(config)
-        result.files_created.append(
-            config.project_dir / config.get_src_path() / "py.typed"
-        )
-
-        create_test_init(config)
-        result.files_created.append(
-            config.project_dir / config.get_test_path() / "__init__.py"
-        )
-
         if verbose:
-            console.print(f"  Created {config.get_src_path()}/py.typed")
-            console.print(f"  Created {config.get_test_path()}/__init__.py")
+            console.print(
+                f"  Created {src_path}/py.typed\n  Created {test_path}/__init__.py"
+            )
 
         # Step 5: Initialize git repository
         if init_git:
             if verbose:
-                console.print()
-                console.print("[bold]🔧 Initializing git repository...[/]")
+                console.print("\n[bold]🔧 Initializing git repository...[/]")
 
             git_success = init_git_repository(config.project_dir)
 
@@ -963,8 +1052,7 @@ def create_project(
         # Step 6: Validate project
         if validate:
             if verbose:
-                console.print()
-                console.print("[bold]✅ Validating project...[/]")
+                console.print("\n[bold]✅ Validating project...[/]")
 
             validation_success, validation_issues = validate_project(config)
             result.validation_passed = validation_success
@@ -975,24 +1063,29 @@ def create_project(
             else:
                 result.warnings.extend(validation_issues)
                 if verbose:
-                    for issue in validation_issues:
-                        console.print(f"  [yellow]⚠[/] {issue}")
+                    console.print(
+                        "\n".join(
+                            f"  [yellow]⚠[/] {issue}" for issue in validation_issues
+                        )
+                    )
 
         # Success!
         result.success = True
 
         if verbose:
-            console.print()
             console.print(
-                Panel(
-                    f"[bold green]✨ Project created successfully![/]\n\n"
-                    f"[dim]Location:[/] {config.project_dir}\n\n"
-                    f"[bold]Next steps:[/]\n"
-                    f"  cd {config.name}\n"
-                    f"  uv sync\n"
-                    f"  uv run pytest",
-                    title="[bold green]Success[/]",
-                    border_style="green",
+                Group(
+                    "",
+                    Panel(
+                        f"[bold green]✨ Project created successfully![/]\n\n"
+                        f"[dim]Location:[/] {config.project_dir}\n\n"
+                        f"[bold]Next steps:[/]\n"
+                        f"  cd {config.name}\n"
+                        f"  uv sync\n"
+                        f"  uv run pytest",
+                        title="[bold green]Success[/]",
+                        border_style="green",
+                    ),
                 )
             )
 
@@ -1005,14 +1098,24 @@ def create_project(
     except Exception as e:
         result.errors.append(str(e))
 
-        # Clean up partial project
+        # Clean up partial project. A cleanup failure must not replace the
+        # original error, so removal is best-effort and only reported.
+        cleanup_note = None
         if config.project_dir.exists():
-            shutil.rmtree(config.project_dir)
-            result.warnings.append("Partial project directory was cleaned up")
+            shutil.rmtree(config.project_dir, ignore_errors=True)
+            if config.project_dir.exists():
+                cleanup_note = (
+                    f"Partial project directory could not be fully removed: "
+                    f"{config.project_dir}"
+                )
+            else:
+                cleanup_note = "Partial project directory was cleaned up"
+            result.warnings.append(cleanup_note)
 
         if verbose:
             console.print(f"\n[bold red]Error:[/] {e}")
-            console.print("[dim]Partial project directory was removed.[/]")
+            if cleanup_note:
+                console.print(f"[dim]{cleanup_note}.[/]")
 
         raise
 
@@ -1024,31 +1127,76 @@ def create_project(
 # =============================================================================
 
 # Feature to template mapping
-FEATURE_TEMPLATES: dict[str, list[tuple[str, str]]] = {
-    "github-actions": [
-        ("github_ci.yml.j2", ".github/workflows/ci.yml"),
-    ],
-    "pre-commit": [
-        ("pre-commit-config.yaml.j2", ".pre-commit-config.yaml"),
-    ],
-    "vscode": [
+FEATURE_TEMPLATES: dict[str, tuple[tuple[str, str], ...]] = {
+    "github-actions": (("github_ci.yml.j2", ".github/workflows/ci.yml"),),
+    "pre-commit": (("pre-commit-config.yaml.j2", ".pre-commit-config.yaml"),),
+    "vscode": (
         ("vscode_settings.json.j2", ".vscode/settings.json"),
         ("vscode_extensions.json.j2", ".vscode/extensions.json"),
-    ],
-    "docker": [
+    ),
+    "docker": (
         ("Dockerfile.j2", "Dockerfile"),
         ("docker-compose.yml.j2", "docker-compose.yml"),
-    ],
-    "docs": [
+    ),
+    "docs": (
         ("mkdocs.yml.j2", "mkdocs.yml"),
         ("docs_index.md.j2", "docs/index.md"),
-    ],
-    "devcontainer": [
-        ("devcontainer.json.j2", ".devcontainer/devcontainer.json"),
-    ],
+    ),
+    "devcontainer": (("devcontainer.json.j2", ".devcontainer/devcontainer.json"),),
 }
 
 
+def find_existing_outputs(path: Path, output_paths: Iterable[str]) -> set[str]:
+    """
+    Find which of the given project-relative paths already exist.
+
+    Each distinct parent directory is listed once with ``os.scandir``
+    instead of issuing one ``stat`` per file; feature files are mostly
+    siblings (e.g. ``.vscode/settings.json`` and ``extensions.json``).
+
+    Parameters
+    ----------
+    path : Path
+        Path to the project root.
+
+    output_paths : Iterable[str]
+        POSIX-style paths relative to ``path``.
+
+    Returns
+    -------
+    set[str]
+        The subset of ``output_paths`` that exist.
+    """
+    by_parent: dict[str, list[str]] = {}
+    for output_path in output_paths:
+        parent, _, name = output_path.rpartition("/")
+        by_parent.setdefault(parent, []).append(name)
+
+    existing: set[str] = set()
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(path / parent) as entries:
+                present = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
+            continue  # Parent missing, so none of its files exist
+        existing.update(
+            f"{parent}/{name}" if parent else name for name in names if name in present
+        )
+
+    return existing
+
+
+def _nested_exists(
+    path: Path, root_dirs: dict[str, bool], directory: str, name: str
+) -> bool:
+    """Check for ``directory/name``, without a stat if the directory is absent."""
+    return root_dirs.get(directory, False) and (path / directory / name).exists()
+
+
+# A supported Python version in a requires-python specifier (not "3.110")
+_PYTHON_VERSION_RE = re.compile(r"3\.1[1-3](?!\d)")
+
+
 def load_project_config(path: Path) -> ProjectConfig:
     """
     Load configuration from an existing project's pyproject.toml.
@@ -1070,11 +1218,6 @@ def load_project_config(path: Path) -> ProjectConfig:
     ValueError
         If the project configuration is invalid.
     """
-    try:
-        import tomllib
-    except ImportError:
-        import tomli as tomllib  # type: ignore[import-not-found]
-
     pyproject_path = path / "pyproject.toml"
     if not pyproject_path.exists():
         raise FileNotFoundError(f"No pyproject.toml found at {path}")
@@ -1082,6 +1225,10 @@ def load_project_config(path: Path) -> ProjectConfig:
     with pyproject_path.open("rb") as f:
         data = tomllib.load(f)
 
+    # List the project root once: whether each entry is a directory
+    with os.scandir(path) as entries:
+        root_dirs = {entry.name: entry.is_dir() for entry in entries}
+
     project = data.get("project", {})
     tool = data.get("tool", {})
 
@@ -1104,22 +1251,21 @@ def load_project_config(path: Path) -> ProjectConfig:
         project_type = ProjectType.CLI
     elif dep_names & api_frameworks:
         project_type = ProjectType.API
-    elif (path / "src").is_dir():
+    elif root_dirs.get("src", False):
         project_type = ProjectType.LIBRARY
-    elif (path / name.replace("-", "_")).is_dir():
+    elif root_dirs.get(name.replace("-", "_"), False):
         # Flat layout: a top-level package directory with no src/.
         project_type = ProjectType.APP
     else:
         project_type = ProjectType.LIBRARY
 
-    # Extract Python version
+    # Extract Python version (the first supported version mentioned, which
+    # is the lower bound in specifiers like ">=3.11,<3.14")
     requires_python = project.get("requires-python", ">=3.12")
-    if "3.13" in requires_python:
-        python_version = PythonVersion.PY313
-    elif "3.11" in requires_python:
-        python_version = PythonVersion.PY311
-    else:
-        python_version = PythonVersion.PY312
+    version_match = _PYTHON_VERSION_RE.search(requires_python)
+    python_version = (
+        PythonVersion(version_match.group()) if version_match else PythonVersion.PY312
+    )
 
     # Extract license
     license_info = project.get("license", {})
@@ -1158,12 +1304,14 @@ def load_project_config(path: Path) -> ProjectConfig:
 
     # Detect existing features
     features = FeaturesConfig(
-        github_actions=(path / ".github" / "workflows").exists(),
-        pre_commit=(path / ".pre-commit-config.yaml").exists(),
-        vscode=(path / ".vscode" / "settings.json").exists(),
-        docker=(path / "Dockerfile").exists(),
-        docs=(path / "mkdocs.yml").exists(),
-        devcontainer=(path / ".devcontainer" / "devcontainer.json").exists(),
+        github_actions=_nested_exists(path, root_dirs, ".github", "workflows"),
+        pre_commit=".pre-commit-config.yaml" in root_dirs,
+        vscode=_nested_exists(path, root_dirs, ".vscode", "settings.json"),
+        docker="Dockerfile" in root_dirs,
+        docs="mkdocs.yml" in root_dirs,
+        devcontainer=_nested_exists(
+            path, root_dirs, ".devcontainer", "devcontainer.json"
+        ),
     )
 
     return ProjectConfig(
@@ -1219,54 +1367,51 @@ def add_feature_to_project(
     # Load project configuration
     config = load_project_config(path)
 
-    # Get templates for this feature
-    templates = FEATURE_TEMPLATES[feature]
-
-    # Check for existing files
-    if not force:
-        existing = []
-        for _, output_path in templates:
-            full_path = path / output_path
-            if full_path.exists():
-                existing.append(str(output_path))
-
-        if existing:
-            raise FileExistsError(
-                f"Files already exist: {', '.join(existing)}. Use --force to overwrite."
-            )
-
-    # Create Jinja environment
-    env = create_jinja_env()
+    # Render every template before writing anything, so a template error
+    # cannot leave a half-added feature behind
+    context = _template_context(config)
+    targets: list[tuple[str, Path, bytes]] = []
+    for template_name, output_path in FEATURE_TEMPLATES[feature]:
+        try:
+            content = _get_template(template_name).render(context)
+        except Exception as e:
+            raise RuntimeError(f"Failed to create {output_path}: {e}") from e
+        targets.append((output_path, path / output_path, content.encode()))
 
-    # Build context
-    context = {
-        "config": config,
-        "quickforge_version": __version__,
-        "year": datetime.now(UTC).year,
-    }
+    # Without force, files are opened in exclusive-create mode: an existing
+    # file makes the open itself fail, so there is no separate existence check
+    mode = "wb" if force else "xb"
 
-    # Render and write templates
-    created_files = []
+    # Write files, remembering which directories are new so that a failed
+    # add can remove them again
+    new_dirs = _missing_dirs(path, (full_path for _, full_path, _ in targets))
+    _make_parent_dirs(full_path for _, full_path, _ in targets)
+    created_files: list[Path] = []
 
-    for template_name, output_path in templates:
+    for output_path, full_path, data in targets:
         try:
-            # Render template
-            template = env.get_template(template_name)
-            content = template.render(**context)
-
-            # Ensure parent directory exists
-            full_path = path / output_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Write file
-            full_path.write_text(content)
+            with full_path.open(mode) as f:
+                f.write(data)
             created_files.append(full_path)
 
         except Exception as e:
-            # Clean up any files we've created
-            for f in created_files:
-                if f.exists():
-                    f.unlink()
+            # Clean up any files and directories we've created
+            for created in created_files:
+                created.unlink(missing_ok=True)
+            for directory in new_dirs:
+                with suppress(OSError):
+                    directory.rmdir()
+
+            if isinstance(e, FileExistsError) and not force:
+                # Rare path: list every conflicting file, not just this one
+                found = find_existing_outputs(
+                    path, (output for output, _, _ in targets)
+                )
+                existing = [output for output, _, _ in targets if output in found]
+                raise FileExistsError(
+                    f"Files already exist: {', '.join(existing)}. "
+                    "Use --force to overwrite."
+                ) from None
             raise RuntimeError(f"Failed to create {output_path}: {e}") from e
 
     return created_files
@@ -42,11 +42,74 @@ PosixPath('src/myproject')
 from __future__ import annotations
 
 import re
-from enum import Enum
+from enum import StrEnum
+from functools import cached_property
 from pathlib import Path
 from typing import Annotated
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+)
+
+
+try:
+    import tomllib
+except ImportError:
+    import tomli as tomllib  # type: ignore[import-not-found]
+
+
+# Simple email pattern - allows most valid addresses
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# Characters allowed in a project name after the leading lowercase letter.
+# Deleting them with bytes.translate leaves an empty result for valid names.
+_PROJECT_NAME_CHARS = b"abcdefghijklmnopqrstuvwxyz0123456789_-"
+
+# Python reserved words that cannot be used as a project name
+_RESERVED_NAMES = frozenset(
+    {
+        "and",
+        "as",
+        "assert",
+        "async",
+        "await",
+        "break",
+        "class",
+        "continue",
+        "def",
+        "del",
+        "elif",
+        "else",
+        "except",
+        "finally",
+        "for",
+        "from",
+        "global",
+        "if",
+        "import",
+        "in",
+        "is",
+        "lambda",
+        "nonlocal",
+        "not",
+        "or",
+        "pass",
+        "raise",
+        "return",
+        "try",
+        "while",
+        "with",
+        "yield",
+        "True",
+        "False",
+        "None",
+    }
+)
 
 
 # =============================================================================
@@ -54,7 +117,7 @@ from pydantic import BaseModel, Field, field_validator, model_validator
 # =============================================================================
 
 
-class ProjectType(str, Enum):
+class ProjectType(StrEnum):
     """
     Supported project types that determine the generated structure.
 
@@ -107,14 +170,7 @@ class ProjectType(str, Enum):
         str
             A short description explaining what this project type creates.
         """
-        descriptions = {
-            ProjectType.LIBRARY: "Publishable PyPI package with src layout",
-            ProjectType.APP: "Standalone application",
-            ProjectType.CLI: "Command-line tool with Typer",
-            ProjectType.API: "Web API service (FastAPI/Flask)",
-            ProjectType.SCRIPT: "Single-file script with inline deps (PEP 723)",
-        }
-        return descriptions[self]
+        return _PROJECT_TYPE_DESCRIPTIONS[self]
 
     @property
     def uses_src_layout(self) -> bool:
@@ -129,10 +185,21 @@ class ProjectType(str, Enum):
         bool
             True if project uses src/ directory structure.
         """
-        return self in {ProjectType.LIBRARY, ProjectType.CLI, ProjectType.API}
+        return self in _SRC_LAYOUT_TYPES
 
 
-class PythonVersion(str, Enum):
+_PROJECT_TYPE_DESCRIPTIONS: dict[ProjectType, str] = {
+    ProjectType.LIBRARY: "Publishable PyPI package with src layout",
+    ProjectType.APP: "Standalone application",
+    ProjectType.CLI: "Command-line tool with Typer",
+    ProjectType.API: "Web API service (FastAPI/Flask)",
+    ProjectType.SCRIPT: "Single-file script with inline deps (PEP 723)",
+}
+
+_SRC_LAYOUT_TYPES = frozenset({ProjectType.LIBRARY, ProjectType.CLI, ProjectType.API})
+
+
+class PythonVersion(StrEnum):
     """
     Supported Python versions for project configuration.
 
@@ -164,7 +231,7 @@ class PythonVersion(str, Enum):
         return f">={self.value}"
 
 
-class License(str, Enum):
+class License(StrEnum):
     """
     Common open-source licenses for project configuration.
 
@@ -222,20 +289,20 @@ class License(str, Enum):
         str
             A valid ``License ::`` trove classifier.
         """
-        classifiers = {
-            License.MIT: "License :: OSI Approved :: MIT License",
-            License.APACHE2: "License :: OSI Approved :: Apache Software License",
-            License.GPL3: (
-                "License :: OSI Approved :: GNU General Public License v3 (GPLv3)"
-            ),
-            License.BSD3: "License :: OSI Approved :: BSD License",
-            License.UNLICENSE: "License :: Public Domain",
-            License.PROPRIETARY: "License :: Other/Proprietary License",
-        }
-        return classifiers[self]
+        return _LICENSE_CLASSIFIERS[self]
+
 
+_LICENSE_CLASSIFIERS: dict[License, str] = {
+    License.MIT: "License :: OSI Approved :: MIT License",
+    License.APACHE2: "License :: OSI Approved :: Apache Software License",
+    License.GPL3: "License :: OSI Approved :: GNU General Public License v3 (GPLv3)",
+    License.BSD3: "License :: OSI Approved :: BSD License",
+    License.UNLICENSE: "License :: Public Domain",
+    License.PROPRIETARY: "License :: Other/Proprietary License",
+}
 
-class TypeCheckingMode(str, Enum):
+
+class TypeCheckingMode(StrEnum):
     """
     Type checking strictness levels for basedpyright/pyright.
 
@@ -274,6 +341,46 @@ class TypeCheckingMode(str, Enum):
 # Configuration Sub-Models
 # =============================================================================
 
+# Tool names that are already in normalized (lowercase, unpadded) form
+_KNOWN_TOOL_NAMES = frozenset(
+    {"ruff", "black", "flake8", "pylint", "basedpyright", "pyright", "mypy"}
+)
+
+
+def _normalize_tool_name(v: str) -> str:
+    """
+    Normalize tool names to lowercase.
+
+    This ensures consistent comparison regardless of user input case.
+    Known tool names (including all the defaults) are already
+    normalized and are returned as-is.
+    """
+    if v in _KNOWN_TOOL_NAMES:
+        return v
+    return v.lower().strip()
+
+
+def _validate_email(v: str | None) -> str | None:
+    """
+    Basic email format validation.
+
+    We use a simple regex rather than strict RFC 5322 compliance
+    to avoid rejecting valid but unusual email addresses.
+    """
+    if v is None:
+        return None
+
+    if not _EMAIL_RE.match(v):
+        msg = f"Invalid email format: {v}"
+        raise ValueError(msg)
+    return v
+
+
+# Field types with their validators attached, so pydantic compiles the
+# validation straight into the core schema.
+ToolName = Annotated[str, AfterValidator(_normalize_tool_name)]
+Email = Annotated[str | None, AfterValidator(_validate_email)]
+
 
 class ToolingConfig(BaseModel):
     """
@@ -308,15 +415,17 @@ class ToolingConfig(BaseModel):
     'mypy'
     """
 
-    linter: str = Field(
+    model_config = ConfigDict(frozen=True)
+
+    linter: ToolName = Field(
         default="ruff",
         description="Linting tool to use (ruff, flake8, pylint)",
     )
-    formatter: str = Field(
+    formatter: ToolName = Field(
         default="ruff",
         description="Code formatting tool (ruff, black)",
     )
-    type_checker: str = Field(
+    type_checker: ToolName = Field(
         default="basedpyright",
         description="Static type checker (basedpyright, pyright, mypy)",
     )
@@ -325,16 +434,6 @@ class ToolingConfig(BaseModel):
         description="Type checking strictness level",
     )
 
-    @field_validator("linter", "formatter", "type_checker")
-    @classmethod
-    def validate_tool_names(cls, v: str) -> str:
-        """
-        Normalize tool names to lowercase.
-
-        This ensures consistent comparison regardless of user input case.
-        """
-        return v.lower().strip()
-
 
 class FeaturesConfig(BaseModel):
     """
@@ -373,9 +472,12 @@ class FeaturesConfig(BaseModel):
     --------
     >>> features = FeaturesConfig(github_actions=True, docker=True)
     >>> features.enabled_features
-    ['github_actions', 'docker']
+    ('github_actions', 'docker', 'pre_commit', 'vscode')
     """
 
+    # Frozen so that the cached enabled_features can never go stale.
+    model_config = ConfigDict(frozen=True)
+
     github_actions: bool = Field(
         default=True,
         description="Include GitHub Actions CI/CD workflows",
@@ -401,17 +503,25 @@ class FeaturesConfig(BaseModel):
         description="Include VS Code workspace settings",
     )
 
-    @property
-    def enabled_features(self) -> list[str]:
+    @cached_property
+    def enabled_features(self) -> tuple[str, ...]:
         """
-        List of feature names that are enabled.
+        Names of the features that are enabled.
+
+        Computed on first access and cached; the model is frozen.
 
         Returns
         -------
-        list[str]
-            Names of features set to True.
+        tuple[str, ...]
+            Names of features set to True, in field order.
         """
-        return [name for name, value in self.model_dump().items() if value is True]
+        # Read the flags straight off the instance; model_dump() would run
+        # pydantic's serializer and build a throwaway dict for this.
+        return tuple(name for name in _FEATURES_FIELDS if getattr(self, name) is True)
+
+
+# Field names of FeaturesConfig, in declaration order
+_FEATURES_FIELDS: tuple[str, ...] = tuple(FeaturesConfig.model_fields)
 
 
 class AuthorInfo(BaseModel):
@@ -435,35 +545,18 @@ class AuthorInfo(BaseModel):
     git config during project creation.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(
         description="Author's name",
         min_length=1,
         max_length=100,
     )
-    email: str | None = Field(
+    email: Email = Field(
         default=None,
         description="Author's email address",
     )
 
-    @field_validator("email")
-    @classmethod
-    def validate_email(cls, v: str | None) -> str | None:
-        """
-        Basic email format validation.
-
-        We use a simple regex rather than strict RFC 5322 compliance
-        to avoid rejecting valid but unusual email addresses.
-        """
-        if v is None:
-            return None
-
-        # Simple email pattern - allows most valid addresses
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(pattern, v):
-            msg = f"Invalid email format: {v}"
-            raise ValueError(msg)
-        return v
-
 
 # =============================================================================
 # Main Configuration Model
@@ -531,6 +624,10 @@ class ProjectConfig(BaseModel):
     create_project : Function that uses this config to generate projects.
     """
 
+    # Frozen so the cached computed properties can never go stale. Sub-model
+    # instances passed in are already validated and are reused, not copied.
+    model_config = ConfigDict(frozen=True, revalidate_instances="never")
+
     # -------------------------------------------------------------------------
     # Required Fields
     # -------------------------------------------------------------------------
@@ -614,7 +711,11 @@ class ProjectConfig(BaseModel):
         v = v.lower().strip()
 
         # Check for valid characters
-        if not re.match(r"^[a-z][a-z0-9_-]*$", v):
+        if not (
+            v.isascii()
+            and "a" <= v[:1] <= "z"
+            and not v.encode().translate(None, _PROJECT_NAME_CHARS)
+        ):
             msg = (
                 f"Invalid project name '{v}'. Names must start with a letter "
                 "and contain only letters, numbers, hyphens, and underscores."
@@ -622,44 +723,7 @@ class ProjectConfig(BaseModel):
             raise ValueError(msg)
 
         # Check against Python reserved words
-        reserved = {
-            "and",
-            "as",
-            "assert",
-            "async",
-            "await",
-            "break",
-            "class",
-            "continue",
-            "def",
-            "del",
-            "elif",
-            "else",
-            "except",
-            "finally",
-            "for",
-            "from",
-            "global",
-            "if",
-            "import",
-            "in",
-            "is",
-            "lambda",
-            "nonlocal",
-            "not",
-            "or",
-            "pass",
-            "raise",
-            "return",
-            "try",
-            "while",
-            "with",
-            "yield",
-            "True",
-            "False",
-            "None",
-        }
-        if v in reserved:
+        if v in _RESERVED_NAMES:
             msg = (
                 f"'{v}' is a Python reserved word and cannot be used as a project name."
             )
@@ -690,7 +754,7 @@ class ProjectConfig(BaseModel):
     # Computed Properties
     # -------------------------------------------------------------------------
 
-    @property
+    @cached_property
     def package_name(self) -> str:
         """
         Convert project name to valid Python package name.
@@ -711,7 +775,7 @@ class ProjectConfig(BaseModel):
         """
         return self.name.replace("-", "_")
 
-    @property
+    @cached_property
     def project_dir(self) -> Path:
         """
         Full path to the project directory.
@@ -723,6 +787,22 @@ class ProjectConfig(BaseModel):
         """
         return self.output_dir / self.name
 
+    @cached_property
+    def src_path(self) -> Path:
+        """
+        Path to the source code directory, relative to the project root.
+
+        Computed once per config; see `get_src_path` for the layout rules.
+
+        Returns
+        -------
+        Path
+            src/{package_name} for src layout, {package_name} otherwise.
+        """
+        if self.project_type.uses_src_layout:
+            return Path("src") / self.package_name
+        return Path(self.package_name)
+
     def get_src_path(self) -> Path:
         """
         Get the path to the source code directory.
@@ -745,9 +825,7 @@ class ProjectConfig(BaseModel):
         >>> config.get_src_path()
         PosixPath('myapp')
         """
-        if self.project_type.uses_src_layout:
-            return Path("src") / self.package_name
-        return Path(self.package_name)
+        return self.src_path
 
     def get_test_path(self) -> Path:
         """
@@ -758,7 +836,7 @@ class ProjectConfig(BaseModel):
         Path
             Relative path to tests directory (always 'tests/').
         """
-        return Path("tests")
+        return _TEST_PATH
 
     # -------------------------------------------------------------------------
     # Serialization Methods
@@ -782,7 +860,7 @@ class ProjectConfig(BaseModel):
         return data
 
     @classmethod
-    def from_toml(cls, path: Path) -> ProjectConfig:
+    def from_toml(cls, path: Path, *, trusted: bool = False) -> ProjectConfig:
         """
         Load configuration from a TOML file.
 
@@ -790,11 +868,15 @@ class ProjectConfig(BaseModel):
         ----------
         path : Path
             Path to the TOML configuration file.
+        trusted : bool
+            Skip validation and build the model directly. Only use this for
+            files quickforge wrote itself via `to_toml_dict`; hand-edited
+            files must go through validation.
 
         Returns
         -------
         ProjectConfig
-            Validated configuration object.
+            Configuration object (validated unless ``trusted`` is set).
 
         Raises
         ------
@@ -803,9 +885,46 @@ class ProjectConfig(BaseModel):
         ValidationError
             If the config file has invalid values.
         """
-        import tomli
-
         with path.open("rb") as f:
-            data = tomli.load(f)
+            data = tomllib.load(f)
 
+        if trusted:
+            return cls._construct_trusted(data)
         return cls(**data)
+
+    @classmethod
+    def _construct_trusted(cls, data: dict) -> ProjectConfig:
+        """
+        Build a config from already-validated TOML data without validation.
+
+        `model_construct` does not coerce values, so the top-level enums
+        and the output path are converted here the way validation would.
+        The small nested models are validated as usual, which also coerces
+        their own enum fields (e.g. ``tooling.type_checking_mode``).
+        """
+        values = dict(data)
+        for key, enum_cls in _TRUSTED_ENUM_FIELDS:
+            if key in values:
+                values[key] = enum_cls(values[key])
+        for key, model_cls in _TRUSTED_MODEL_FIELDS:
+            if key in values:
+                values[key] = model_cls.model_validate(values[key])
+        if "output_dir" in values:
+            values["output_dir"] = Path(values["output_dir"])
+        return cls.model_construct(**values)
+
+
+# Tests directory, relative to the project root (the same for every project)
+_TEST_PATH = Path("tests")
+
+# Field conversions applied by ProjectConfig._construct_trusted
+_TRUSTED_ENUM_FIELDS: tuple[tuple[str, type[StrEnum]], ...] = (
+    ("project_type", ProjectType),
+    ("python_version", PythonVersion),
+    ("license", License),
+)
+_TRUSTED_MODEL_FIELDS: tuple[tuple[str, type[BaseModel]], ...] = (
+    ("author", AuthorInfo),
+    ("tooling", ToolingConfig),
+    ("features", FeaturesConfig),
+)
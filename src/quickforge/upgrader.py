@@ -73,11 +73,12 @@ See Also
 
 from __future__ import annotations
 
+import os
 import re
 import shutil
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from enum import Enum
+from enum import StrEnum
 from pathlib import Path
 
 
@@ -97,7 +98,7 @@ from quickforge.auditor import (
 )
 
 
-class SourceTool(str, Enum):
+class SourceTool(StrEnum):
     """
     Source package managers/tools to migrate from.
     """
@@ -108,7 +109,7 @@ class SourceTool(str, Enum):
     SETUPTOOLS = "setuptools"
 
 
-class MigrationType(str, Enum):
+class MigrationType(StrEnum):
     """
     Types of migrations that can be performed.
     """
@@ -120,6 +121,16 @@ class MigrationType(str, Enum):
     CONFIG = "config"
     CI_CD = "ci_cd"
 
+    @property
+    def display_label(self) -> str:
+        """Human-readable label, e.g. ``'package manager'``."""
+        return _MIGRATION_TYPE_LABELS[self]
+
+
+_MIGRATION_TYPE_LABELS: dict[MigrationType, str] = {
+    mt: mt.value.replace("_", " ") for mt in MigrationType
+}
+
 
 @dataclass
 class MigrationStep:
@@ -194,6 +205,31 @@ class UpgradeResult:
 # =============================================================================
 
 
+# Config files saved by create_backup, relative to the project root
+_BACKUP_FILES = (
+    "pyproject.toml",
+    "poetry.lock",
+    "requirements.txt",
+    "requirements-dev.txt",
+    "setup.py",
+    "setup.cfg",
+    ".flake8",
+    ".isort.cfg",
+    "mypy.ini",
+    ".mypy.ini",
+    "Pipfile",
+    "Pipfile.lock",
+    ".pre-commit-config.yaml",
+)
+
+# Backed-up files that can be hard-linked instead of copied. Lock files are
+# the large ones, and the migrations only ever delete them, never rewrite
+# them in place, so a link keeps the original content. Everything else may
+# be edited in place (pyproject.toml is rewritten through the same inode)
+# and must be copied.
+_LINKED_BACKUP_FILES = frozenset({"poetry.lock", "Pipfile.lock"})
+
+
 def create_backup(path: Path) -> Path:
     """
     Create a timestamped backup of the project's config files.
@@ -212,27 +248,22 @@ def create_backup(path: Path) -> Path:
     backup_dir = path / f".quickforge_backup_{timestamp}"
     backup_dir.mkdir(exist_ok=True)
 
-    # Files to backup
-    backup_files = [
-        "pyproject.toml",
-        "poetry.lock",
-        "requirements.txt",
-        "requirements-dev.txt",
-        "setup.py",
-        "setup.cfg",
-        ".flake8",
-        ".isort.cfg",
-        "mypy.ini",
-        ".mypy.ini",
-        "Pipfile",
-        "Pipfile.lock",
-        ".pre-commit-config.yaml",
-    ]
-
-    for filename in backup_files:
-        src = path / filename
-        if src.exists():
-            shutil.copy2(src, backup_dir / filename)
+    # All candidates live in the project root: list it once instead of
+    # checking each file separately
+    with os.scandir(path) as entries:
+        present = {entry.name for entry in entries if entry.is_file()}
+
+    for filename in _BACKUP_FILES:
+        if filename in present:
+            src = path / filename
+            dest = backup_dir / filename
+            if filename in _LINKED_BACKUP_FILES:
+                try:
+                    dest.hardlink_to(src)
+                    continue
+                except OSError:
+                    pass  # No hard links here (other device, FAT, ...): copy
+            shutil.copy2(src, dest)
 
     return backup_dir
 
@@ -243,9 +274,11 @@ def create_backup(path: Path) -> Path:
 
 
 def _read_toml_doc(path: Path) -> tomlkit.TOMLDocument | None:
-    """Read a TOML file as a tomlkit document (preserves formatting)."""
-    if not path.exists():
-        return None
+    """
+    Read a TOML file as a tomlkit document (preserves formatting).
+
+    Returns None if the file is missing or cannot be parsed.
+    """
     try:
         with path.open(encoding="utf-8") as f:
             return tomlkit.load(f)
@@ -261,19 +294,19 @@ def _write_toml_doc(path: Path, doc: tomlkit.TOMLDocument) -> None:
 
 def _ensure_pyproject_exists(path: Path) -> tomlkit.TOMLDocument:
     """Ensure pyproject.toml exists, creating minimal one if needed."""
-    pyproject_path = path / "pyproject.toml"
+    doc = _read_toml_doc(path / "pyproject.toml")
+    if doc:
+        return doc
+    return _create_minimal_pyproject(path.name)
 
-    if pyproject_path.exists():
-        doc = _read_toml_doc(pyproject_path)
-        if doc:
-            return doc
 
-    # Create minimal pyproject.toml
+def _create_minimal_pyproject(name: str) -> tomlkit.TOMLDocument:
+    """Build the minimal pyproject.toml used when a project has none."""
     doc = tomlkit.document()
     doc.add(tomlkit.comment("Created by quickforge upgrade"))
 
     project = tomlkit.table()
-    project.add("name", path.name)
+    project.add("name", name)
     project.add("version", "0.1.0")
     project.add("requires-python", ">=3.11")
     doc.add("project", project)
@@ -1106,6 +1139,7 @@ def upgrade_project(
     from_tool: str | None = None,
     dry_run: bool = False,
     backup: bool = True,
+    steps: list[MigrationStep] | None = None,
 ) -> UpgradeResult:
     """
     Upgrade a Python project to modern tooling.
@@ -1124,6 +1158,11 @@ def upgrade_project(
     backup : bool, default=True
         If True, create backup of original files.
 
+    steps : list[MigrationStep] | None
+        A plan previously returned by ``create_migration_plan`` for this
+        project, e.g. one already shown to the user for confirmation.
+        If None, the plan is computed here.
+
     Returns
     -------
     UpgradeResult
@@ -1149,8 +1188,9 @@ def upgrade_project(
         result.backup_path = create_backup(path)
         result.changes_made.append(f"Created backup at {result.backup_path}")
 
-    # Get migration plan
-    steps = create_migration_plan(path, from_tool)
+    # Get migration plan (unless the caller already has one)
+    if steps is None:
+        steps = create_migration_plan(path, from_tool)
     result.migration_steps = steps
 
     if not steps:
@@ -1170,20 +1210,21 @@ def upgrade_project(
             if step.migration_type == MigrationType.PACKAGE_MANAGER:
                 if step.source == "poetry":
                     changes = _migrate_poetry_to_uv(path, dry_run)
-                    # Re-read doc after package manager migration
-                    doc = _read_toml_doc(pyproject_path) or doc
                 elif step.source == "pip":
                     changes = _migrate_requirements_to_uv(path, dry_run)
-                    doc = _read_toml_doc(pyproject_path) or doc
                 elif step.source == "pipenv":
                     changes = _migrate_pipenv_to_uv(path, dry_run)
-                    doc = _read_toml_doc(pyproject_path) or doc
                 elif step.source == "setuptools":
                     changes = _migrate_setuptools_to_uv(path, dry_run)
-                    doc = _read_toml_doc(pyproject_path) or doc
                 else:
                     changes = [f"Unknown source tool: {step.source}"]
 
+                # Re-read doc after package manager migration. A dry run
+                # writes nothing, so the document in hand is still current
+                # and is not parsed again.
+                if not dry_run:
+                    doc = _read_toml_doc(pyproject_path) or doc
+
                 result.changes_made.extend(changes)
 
             elif step.migration_type == MigrationType.FORMATTER:
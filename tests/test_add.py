@@ -1,15 +1,19 @@
 """Tests for quickforge add command and add_feature_to_project function."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
+from jinja2 import Template, TemplateError
 
 from quickforge.generator import (
     FEATURE_TEMPLATES,
+    _get_template,
     add_feature_to_project,
+    find_existing_outputs,
     load_project_config,
 )
-from quickforge.models import ProjectType
+from quickforge.models import ProjectType, PythonVersion
 
 
 class TestLoadProjectConfig:
@@ -34,6 +38,40 @@ authors = [
         assert config.name == "testproject"
         assert config.description == "A test project"
 
+    def test_load_detects_features(self, tmp_path: Path) -> None:
+        """Test existing feature files are reflected in the features config."""
+        (tmp_path / "pyproject.toml").write_text('[project]\nname = "test"\n')
+        (tmp_path / ".github" / "workflows").mkdir(parents=True)
+        (tmp_path / ".vscode").mkdir()  # No settings.json inside
+        (tmp_path / "Dockerfile").touch()
+
+        features = load_project_config(tmp_path).features
+
+        assert features.github_actions is True
+        assert features.vscode is False
+        assert features.docker is True
+        assert features.pre_commit is False
+        assert features.devcontainer is False
+
+    @pytest.mark.parametrize(
+        ("requires_python", "expected"),
+        [
+            (">=3.11", PythonVersion.PY311),
+            (">=3.13", PythonVersion.PY313),
+            (">=3.11,<3.14", PythonVersion.PY311),
+            (">=3.10", PythonVersion.PY312),
+            (">=3.110", PythonVersion.PY312),
+        ],
+    )
+    def test_load_python_version(
+        self, tmp_path: Path, requires_python: str, expected: PythonVersion
+    ) -> None:
+        """Test the Python version is taken from requires-python."""
+        (tmp_path / "pyproject.toml").write_text(
+            f'[project]\nname = "test"\nrequires-python = "{requires_python}"\n'
+        )
+        assert load_project_config(tmp_path).python_version == expected
+
     def test_load_cli_project(self, tmp_path: Path) -> None:
         """Test loading CLI project configuration."""
         pyproject = tmp_path / "pyproject.toml"
@@ -114,6 +152,34 @@ class TestFeatureTemplates:
                 assert output_path, f"{feature} has empty output path"
 
 
+class TestFindExistingOutputs:
+    """Tests for find_existing_outputs function."""
+
+    def test_finds_root_and_nested_files(self, tmp_path: Path) -> None:
+        """Existing files are found at the root and in subdirectories."""
+        (tmp_path / "Dockerfile").touch()
+        (tmp_path / ".vscode").mkdir()
+        (tmp_path / ".vscode" / "settings.json").touch()
+
+        found = find_existing_outputs(
+            tmp_path,
+            [
+                "Dockerfile",
+                "docker-compose.yml",
+                ".vscode/settings.json",
+                ".vscode/extensions.json",
+            ],
+        )
+
+        assert found == {"Dockerfile", ".vscode/settings.json"}
+
+    def test_missing_parent_directory(self, tmp_path: Path) -> None:
+        """A missing parent directory means none of its files exist."""
+        found = find_existing_outputs(tmp_path, [".github/workflows/ci.yml"])
+
+        assert found == set()
+
+
 class TestAddFeatureToProject:
     """Tests for add_feature_to_project function."""
 
@@ -226,6 +292,47 @@ requires-python = ">=3.12"
         with pytest.raises(FileExistsError):
             add_feature_to_project(tmp_path, "pre-commit", force=False)
 
+    def test_add_existing_feature_leaves_no_partial_files(self, tmp_path: Path) -> None:
+        """Test a conflict on a later file removes the files already written."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+        vscode = tmp_path / ".vscode"
+        vscode.mkdir()
+        (vscode / "extensions.json").write_text("{}")
+
+        with pytest.raises(FileExistsError, match=r"\.vscode/extensions\.json"):
+            add_feature_to_project(tmp_path, "vscode", force=False)
+
+        assert not (vscode / "settings.json").exists()
+        assert (vscode / "extensions.json").read_text() == "{}"
+
+    def test_add_existing_feature_leaves_no_new_dirs(self, tmp_path: Path) -> None:
+        """Test a conflict removes the directories created for the feature."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+        (tmp_path / "mkdocs.yml").write_text("site_name: existing")
+
+        with pytest.raises(FileExistsError, match=r"mkdocs\.yml"):
+            add_feature_to_project(tmp_path, "docs", force=False)
+
+        assert not (tmp_path / "docs").exists()
+        assert (tmp_path / "mkdocs.yml").read_text() == "site_name: existing"
+
+    def test_render_error_writes_nothing(self, tmp_path: Path) -> None:
+        """Test a failing template aborts before any file is written."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+
+        def get_template(name: str) -> Template:
+            if name == "vscode_extensions.json.j2":
+                raise TemplateError("broken")
+            return _get_template(name)
+
+        with (
+            patch("quickforge.generator._get_template", side_effect=get_template),
+            pytest.raises(RuntimeError, match=r"extensions\.json"),
+        ):
+            add_feature_to_project(tmp_path, "vscode")
+
+        assert not (tmp_path / ".vscode").exists()
+
     def test_add_existing_feature_with_force(self, tmp_path: Path) -> None:
         """Test that adding existing files works with --force."""
         pyproject = tmp_path / "pyproject.toml"
@@ -1,6 +1,7 @@
 """Tests for quickforge.auditor module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -9,10 +10,18 @@ from quickforge.auditor import (
     AuditResult,
     Recommendation,
     Severity,
+    _calculate_score,
+    _detect_package_manager,
+    _generate_code_quality_recommendations,
+    _ProjectIndex,
+    _pyproject_tools,
+    _read_ini,
+    _read_toml,
     analyze_type_coverage,
     audit_project,
     detect_ci,
     detect_formatter,
+    detect_import_sorter,
     detect_linter,
     detect_package_manager,
     detect_pre_commit,
@@ -132,6 +141,55 @@ line-length = 88
         formatter, _info = detect_formatter(tmp_path)
         assert formatter == "black"
 
+    def test_ruff_not_a_table(self, tmp_path: Path) -> None:
+        """Test a malformed non-table [tool.ruff] is ignored."""
+        (tmp_path / "pyproject.toml").write_text('[tool]\nruff = "format"\n')
+        formatter, _info = detect_formatter(tmp_path)
+        assert formatter is None
+
+
+class TestDetectImportSorter:
+    """Tests for detect_import_sorter function."""
+
+    def test_detect_ruff_isort_rules(self, tmp_path: Path) -> None:
+        """Test ruff counts as import sorter when I rules are selected."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.ruff.lint]\nselect = ["E", "I001"]\n'
+        )
+        sorter, _info = detect_import_sorter(tmp_path)
+        assert sorter == "ruff"
+
+    def test_detect_ruff_isort_section(self, tmp_path: Path) -> None:
+        """Test ruff counts as import sorter with a [tool.ruff.lint.isort] table."""
+        (tmp_path / "pyproject.toml").write_text("[tool.ruff.lint.isort]\n")
+        sorter, _info = detect_import_sorter(tmp_path)
+        assert sorter == "ruff"
+
+    def test_ruff_without_isort_rules(self, tmp_path: Path) -> None:
+        """Test plain ruff linting is not reported as import sorting."""
+        (tmp_path / "pyproject.toml").write_text(
+            '[tool.ruff.lint]\nselect = ["E", "F"]\n'
+        )
+        sorter, _info = detect_import_sorter(tmp_path)
+        assert sorter is None
+
+    def test_ruff_lint_not_a_table(self, tmp_path: Path) -> None:
+        """Test malformed ruff settings degrade to no import sorter."""
+        for content in (
+            '[tool]\nruff = "x"\n',
+            '[tool.ruff]\nlint = "isort"\n',
+            '[tool.ruff.lint]\nselect = "I"\n',
+        ):
+            (tmp_path / "pyproject.toml").write_text(content)
+            sorter, _info = detect_import_sorter(tmp_path)
+            assert sorter is None, content
+
+    def test_detect_isort(self, tmp_path: Path) -> None:
+        """Test detection of standalone isort."""
+        (tmp_path / "setup.cfg").write_text("[isort]\nprofile = black\n")
+        sorter, _info = detect_import_sorter(tmp_path)
+        assert sorter == "isort"
+
 
 class TestDetectTypeChecker:
     """Tests for detect_type_checker function."""
@@ -189,6 +247,23 @@ class TestDetectCI:
         ci, _info = detect_ci(tmp_path)
         assert ci == "gitlab-ci"
 
+    def test_counts_github_workflows(self, tmp_path: Path) -> None:
+        """Test .yml and .yaml workflow files are counted, other files not."""
+        workflows = tmp_path / ".github" / "workflows"
+        workflows.mkdir(parents=True)
+        for name in ("ci.yml", "release.yaml", "README.md"):
+            (workflows / name).touch()
+        ci, info = detect_ci(tmp_path)
+        assert ci == "github-actions"
+        assert info == {"workflows": "2"}
+
+    def test_empty_workflows_dir_falls_through(self, tmp_path: Path) -> None:
+        """Test an empty workflows directory does not count as GitHub Actions."""
+        (tmp_path / ".github" / "workflows").mkdir(parents=True)
+        (tmp_path / ".travis.yml").touch()
+        ci, _info = detect_ci(tmp_path)
+        assert ci == "travis-ci"
+
     def test_detect_no_ci(self, tmp_path: Path) -> None:
         """Test when no CI is configured."""
         ci, _info = detect_ci(tmp_path)
@@ -247,6 +322,134 @@ def func2(a, b):
         assert typed == 0
         assert total == 0
 
+    def test_counts_nested_functions(self, tmp_path: Path) -> None:
+        """Test functions nested in classes and compound statements count."""
+        (tmp_path / "nested.py").write_text("""
+class A:
+    def method(self) -> None:
+        def inner(x):
+            return x
+
+if True:
+    def in_if(x: int): ...
+else:
+    async def in_else(x): ...
+
+try:
+    def in_try(): ...
+except ImportError:
+    def in_except(x: str): ...
+finally:
+    def in_finally(): ...
+
+match 1:
+    case 1:
+        def in_case() -> int: ...
+
+for _ in range(1):
+    with open("f") as f:
+        def in_with(y: int): ...
+
+callback = lambda x: x
+""")
+        _, typed, total = analyze_type_coverage(tmp_path)
+        assert (typed, total) == (5, 9)
+
+    def test_honours_source_encoding(self, tmp_path: Path) -> None:
+        """Test PEP 263 coding declarations are respected and bad bytes skipped."""
+        (tmp_path / "latin.py").write_bytes(
+            "# -*- coding: latin-1 -*-\ndef f(x: str) -> str:\n    return 'caf\u00e9'\n".encode(
+                "latin-1"
+            )
+        )
+        (tmp_path / "garbage.py").write_bytes(b"def g(x):\n    return '\xff'\n")
+
+        assert analyze_type_coverage(tmp_path) == (100.0, 1, 1)
+
+    def test_files_without_functions(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test files without any def are counted without being parsed."""
+        (tmp_path / "__init__.py").write_text('__all__ = ["VERSION"]\nVERSION = 1\n')
+
+        def fail_parse(*args: object, **kwargs: object) -> None:
+            raise AssertionError("ast.parse should not be called")
+
+        monkeypatch.setattr("quickforge.auditor.ast.parse", fail_parse)
+        assert analyze_type_coverage(tmp_path) == (100.0, 0, 0)
+
+    def test_skips_excluded_directories(self, tmp_path: Path) -> None:
+        """Test virtualenvs and build output are not counted."""
+        project = tmp_path / "build"  # Only directories inside the root are pruned
+        (project / "pkg" / "sub").mkdir(parents=True)
+        (project / "pkg" / "sub" / "mod.py").write_text("def f(x: int): ...\n")
+        for excluded in (".venv", "node_modules", "dist"):
+            (project / excluded).mkdir()
+            (project / excluded / "lib.py").write_text("def g(x): ...\n")
+
+        assert analyze_type_coverage(project) == (100.0, 1, 1)
+
+    def test_parallel_matches_serial(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the process pool path gives the same counts as serial parsing."""
+        for i in range(6):
+            (tmp_path / f"mod{i}.py").write_text(
+                "def typed(x: int) -> int:\n    return x\n\n"
+                "def untyped(x):\n    return x\n"
+            )
+        (tmp_path / "broken.py").write_text("def broken(:\n")
+
+        serial = analyze_type_coverage(tmp_path)
+        monkeypatch.setattr("quickforge.auditor._PARALLEL_MIN_FILES", 2)
+        assert analyze_type_coverage(tmp_path) == serial == (50.0, 6, 12)
+
+
+class TestCodeQualityRecommendations:
+    """Tests for the type coverage recommendation bands."""
+
+    @pytest.mark.parametrize(
+        ("coverage", "expected"),
+        [
+            (0.0, (Severity.WARNING, "Low")),
+            (24.9, (Severity.WARNING, "Low")),
+            (25.0, (Severity.INFO, "Moderate")),
+            (50.0, (Severity.INFO, "Good")),
+            (79.9, (Severity.INFO, "Good")),
+            (80.0, None),
+            (100.0, None),
+        ],
+    )
+    def test_coverage_bands(
+        self, coverage: float, expected: tuple[Severity, str] | None
+    ) -> None:
+        """Test band edges map to the right severity and message."""
+        result = AuditResult(project_path=Path())
+        _generate_code_quality_recommendations(result, coverage, 1, 4)
+
+        if expected is None:
+            assert result.recommendations == []
+        else:
+            (rec,) = result.recommendations
+            assert rec.category == AuditCategory.CODE_QUALITY
+            assert rec.severity == expected[0]
+            assert rec.message.startswith(expected[1])
+            assert f"({coverage:.0f}%)" in rec.message
+
+    def test_low_band_message(self) -> None:
+        """Test the low band reports the function counts."""
+        result = AuditResult(project_path=Path())
+        _generate_code_quality_recommendations(result, 10.0, 1, 10)
+        assert result.recommendations[0].message == (
+            "Low type annotation coverage (10%). Only 1/10 functions have type hints"
+        )
+
+    def test_no_functions(self) -> None:
+        """Test projects without functions get no coverage recommendation."""
+        result = AuditResult(project_path=Path())
+        _generate_code_quality_recommendations(result, 0.0, 0, 0)
+        assert result.recommendations == []
+
 
 class TestAuditProject:
     """Tests for audit_project function."""
@@ -277,6 +480,20 @@ typeCheckingMode = "standard"
         assert result.tooling_detected["package_manager"] == "uv"
         assert result.tooling_detected["linter"] == "ruff"
         assert result.tooling_detected["type_checker"] == "basedpyright"
+        assert result.tooling_detected["status"] == "modern"
+
+    def test_modern_project_skips_type_coverage(self, tmp_path: Path) -> None:
+        """Test sources of an already modern project are not parsed."""
+        (tmp_path / "uv.lock").touch()
+        (tmp_path / ".pre-commit-config.yaml").touch()
+        (tmp_path / "pyproject.toml").write_text("[tool.ruff]\n[tool.pyright]\n")
+        (tmp_path / "mod.py").write_text("def f(x):\n    return x\n")
+
+        with patch("quickforge.auditor.analyze_type_coverage") as analyze:
+            result = audit_project(tmp_path)
+
+        analyze.assert_not_called()
+        assert "type_coverage" not in result.tooling_detected
 
     def test_audit_legacy_project(self, tmp_path: Path) -> None:
         """Test auditing a legacy project."""
@@ -308,6 +525,23 @@ profile = "black"
         assert any("flake8" in m.lower() or "ruff" in m.lower() for m in messages)
         assert any("mypy" in m.lower() or "basedpyright" in m.lower() for m in messages)
 
+    def test_tooling_recommendations_are_shared(self, tmp_path: Path) -> None:
+        """Test repeated audits reuse the same recommendation instances."""
+        (tmp_path / "requirements.txt").write_text("requests>=2.0")
+        (tmp_path / ".flake8").write_text("[flake8]\n")
+
+        first = audit_project(tmp_path).recommendations
+        second = audit_project(tmp_path).recommendations
+
+        assert [r.message for r in first] == [
+            "Consider migrating from pip/requirements.txt to uv with pyproject.toml",
+            "Consider migrating from flake8 to ruff for better performance",
+            "No type checker detected. Consider adding basedpyright",
+            "No pre-commit hooks detected. Consider adding pre-commit",
+            "No CI/CD configuration detected. Consider adding GitHub Actions",
+        ]
+        assert all(a is b for a, b in zip(first, second, strict=True))
+
     def test_audit_nonexistent_path(self, tmp_path: Path) -> None:
         """Test auditing a non-existent path."""
         with pytest.raises(FileNotFoundError):
@@ -341,3 +575,175 @@ class TestAuditResult:
         assert result.error_count == 1
         assert result.warning_count == 1
         assert result.info_count == 2
+
+    def test_score_weights_severities(self) -> None:
+        """Test each severity deducts its weight and the score bottoms at 0."""
+        result = AuditResult(
+            project_path=Path(),
+            recommendations=[
+                Recommendation(AuditCategory.TOOLING, "c", Severity.CRITICAL),
+                Recommendation(AuditCategory.TOOLING, "e", Severity.ERROR),
+                Recommendation(AuditCategory.TOOLING, "w", Severity.WARNING),
+                Recommendation(AuditCategory.TOOLING, "i", Severity.INFO),
+            ],
+        )
+        assert _calculate_score(result) == 64
+
+        result.recommendations.extend(
+            [Recommendation(AuditCategory.TOOLING, "c", Severity.CRITICAL)] * 5
+        )
+        assert _calculate_score(result) == 0
+
+    def test_records_have_no_instance_dict(self) -> None:
+        """Test audit records are slotted and recommendations are immutable."""
+        rec = Recommendation(AuditCategory.TOOLING, "msg", Severity.INFO)
+        result = AuditResult(project_path=Path(), recommendations=[rec])
+        assert not hasattr(rec, "__dict__")
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(AttributeError):
+            rec.message = "changed"  # type: ignore[misc]
+
+    def test_recommendation_texts_are_interned(self) -> None:
+        """Test equal messages and actions share a single string object."""
+        parts = ("Add a ", "type checker")
+        first = Recommendation(
+            AuditCategory.TOOLING, "".join(parts), Severity.INFO, action="".join(parts)
+        )
+        second = Recommendation(
+            AuditCategory.TOOLING, "".join(parts), Severity.INFO, action=None
+        )
+        assert first.message is second.message
+        assert first.action is first.message
+        assert second.action is None
+
+    def test_severity_counts_follow_appends(self) -> None:
+        """Test counts are refreshed when recommendations are added later."""
+        result = AuditResult(project_path=Path())
+        assert result.error_count == 0
+
+        result.recommendations.append(
+            Recommendation(AuditCategory.TOOLING, "late", Severity.ERROR)
+        )
+        assert result.error_count == 1
+        assert result.severity_counts == {Severity.ERROR: 1}
+
+
+class TestReadToml:
+    """Tests for the cached TOML reader."""
+
+    def test_reuses_parsed_file(self, tmp_path: Path) -> None:
+        """Test an unchanged file is parsed only once."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[tool.ruff]\nline-length = 88\n")
+        first = _read_toml(pyproject)
+        assert first == {"tool": {"ruff": {"line-length": 88}}}
+        assert _read_toml(pyproject) is first
+
+    def test_rereads_changed_file(self, tmp_path: Path) -> None:
+        """Test editing the file invalidates the cached result."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("[tool.ruff]\n")
+        assert _read_toml(pyproject) == {"tool": {"ruff": {}}}
+        pyproject.write_text("[tool.black]\nline-length = 100\n")
+        assert _read_toml(pyproject) == {"tool": {"black": {"line-length": 100}}}
+
+    def test_missing_or_invalid_file(self, tmp_path: Path) -> None:
+        """Test missing and unparsable files yield None."""
+        assert _read_toml(tmp_path / "pyproject.toml") is None
+        broken = tmp_path / "broken.toml"
+        broken.write_text("[tool\n")
+        assert _read_toml(broken) is None
+        binary = tmp_path / "binary.toml"
+        binary.write_bytes(b"key = '\xff'\n")
+        assert _read_toml(binary) is None
+
+
+class TestPyprojectTools:
+    """Tests for the [tool] table lookup shared by the detectors."""
+
+    def test_returns_tool_table(self, tmp_path: Path) -> None:
+        """Test the [tool] table is returned as-is."""
+        (tmp_path / "pyproject.toml").write_text("[tool.ruff]\n[tool.mypy]\n")
+        index = _ProjectIndex.scan(tmp_path)
+        assert set(_pyproject_tools(tmp_path, index)) == {"ruff", "mypy"}
+
+    def test_missing_or_malformed_tool_table(self, tmp_path: Path) -> None:
+        """Test a missing file or a non-table ``tool`` key yields ``{}``."""
+        assert _pyproject_tools(tmp_path, _ProjectIndex.scan(tmp_path)) == {}
+        (tmp_path / "pyproject.toml").write_text('tool = "ruff"\n')
+        assert _pyproject_tools(tmp_path, _ProjectIndex.scan(tmp_path)) == {}
+        assert detect_linter(tmp_path) == (None, {})
+
+
+class TestProjectIndex:
+    """Tests for the shared project root listing."""
+
+    def test_scan(self, tmp_path: Path) -> None:
+        """Test the root listing and the derived flags."""
+        (tmp_path / "pyproject.toml").touch()
+        (tmp_path / ".pre-commit-config.yaml").touch()
+        (tmp_path / ".github" / "workflows").mkdir(parents=True)
+        index = _ProjectIndex.scan(tmp_path)
+        assert index.top_level == {
+            "pyproject.toml",
+            ".pre-commit-config.yaml",
+            ".github",
+        }
+        assert index.has_github_workflows
+        assert index.has_pre_commit_config
+
+    def test_scan_missing_directory(self, tmp_path: Path) -> None:
+        """Test an unreadable root yields an empty index."""
+        index = _ProjectIndex.scan(tmp_path / "missing")
+        assert index.top_level == frozenset()
+        assert not index.has_github_workflows
+
+    def test_detectors_use_given_index(self, tmp_path: Path) -> None:
+        """Test detectors answer from the index instead of re-listing."""
+        index = _ProjectIndex.scan(tmp_path)
+        (tmp_path / "uv.lock").touch()
+        assert _detect_package_manager(tmp_path, index) == (None, {})
+        assert detect_package_manager(tmp_path)[0] == "uv"
+
+    def test_extra_requirements_files(self, tmp_path: Path) -> None:
+        """Test additional requirements files are listed in name order."""
+        for name in (
+            "requirements.txt",
+            "requirements-test.txt",
+            "requirements-dev.txt",
+        ):
+            (tmp_path / name).touch()
+        _manager, info = detect_package_manager(tmp_path)
+        assert list(info) == [
+            "requirements",
+            "requirements-dev.txt",
+            "requirements-test.txt",
+        ]
+
+
+class TestReadIni:
+    """Tests for the cached INI reader."""
+
+    def test_reuses_parsed_file(self, tmp_path: Path) -> None:
+        """Test an unchanged setup.cfg is parsed only once."""
+        setup_cfg = tmp_path / "setup.cfg"
+        setup_cfg.write_text("[flake8]\nmax-line-length = 88\n")
+        first = _read_ini(setup_cfg)
+        assert first is not None
+        assert first.has_section("flake8")
+        assert _read_ini(setup_cfg) is first
+
+    def test_rereads_changed_file(self, tmp_path: Path) -> None:
+        """Test editing the file invalidates the cached parser."""
+        setup_cfg = tmp_path / "setup.cfg"
+        setup_cfg.write_text("[flake8]\n")
+        assert _read_ini(setup_cfg).has_section("flake8")  # type: ignore[union-attr]
+        setup_cfg.write_text("[isort]\nprofile = black\n")
+        assert _read_ini(setup_cfg).has_section("isort")  # type: ignore[union-attr]
+
+    def test_missing_or_invalid_file(self, tmp_path: Path) -> None:
+        """Test missing and unparsable files yield None."""
+        assert _read_ini(tmp_path / "setup.cfg") is None
+        setup_cfg = tmp_path / "setup.cfg"
+        setup_cfg.write_text("no section header\n")
+        assert _read_ini(setup_cfg) is None
@@ -10,15 +10,30 @@ Test Organization
 - TestVersionCommand: Tests for --version flag
 - TestNewCommand: Tests for the new command
 - TestHelpOutput: Tests for help text
+- TestImportCost: Tests that the CLI module imports lazily
+- TestGitIdentityDefaults: Tests for author defaults read from git config
+- TestSimplePrompts: Tests for the plain-text prompt fallback
 """
 
+import subprocess
+import sys
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from typer.testing import CliRunner
 
 from quickforge import __version__
-from quickforge.cli import app
+from quickforge.cli import (
+    _git_identity_defaults,
+    _select,
+    _simple_checkbox,
+    _simple_confirm,
+    _simple_select,
+    _simple_text,
+    _use_simple_prompts,
+    app,
+)
 
 
 # =============================================================================
@@ -61,6 +76,27 @@ class TestVersionCommand:
         assert __version__ in result.stdout
 
 
+class TestImportCost:
+    """The CLI module must stay cheap to import."""
+
+    def test_import_does_not_load_heavy_modules(self) -> None:
+        """Importing the CLI does not pull in the generator or its deps."""
+        code = (
+            "import sys, quickforge.cli; "
+            "heavy = ['quickforge.generator', 'quickforge.auditor', "
+            "'quickforge.upgrader', 'jinja2', 'pydantic', 'questionary']; "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.stdout.strip() == ""
+
+
 # =============================================================================
 # Help Output Tests
 # =============================================================================
@@ -324,6 +360,31 @@ class TestNewCommand:
         assert result.exit_code == 1
         assert "Invalid project type" in result.stdout
 
+    def test_new_options_are_case_insensitive(
+        self, runner: CliRunner, temp_dir: Path
+    ) -> None:
+        """Enum options accept any casing of their values."""
+        result = runner.invoke(
+            app,
+            [
+                "new",
+                "testproject",
+                "--type",
+                "CLI",
+                "--license",
+                "apache-2.0",
+                "--yes",
+                "--output",
+                str(temp_dir),
+                "--no-git",
+            ],
+        )
+
+        assert result.exit_code == 0, result.stdout
+        pyproject = (temp_dir / "testproject" / "pyproject.toml").read_text()
+        assert "Apache-2.0" in pyproject
+        assert "typer" in pyproject
+
     def test_new_invalid_python_version(
         self, runner: CliRunner, temp_dir: Path
     ) -> None:
@@ -411,6 +472,53 @@ class TestPhase3Commands:
             or "Detected" in result.stdout
         )
 
+    def test_audit_quiet(self, runner: CliRunner, temp_dir: Path) -> None:
+        """--quiet prints a plain-text summary without rich widgets."""
+        project_dir = temp_dir / "project"
+        project_dir.mkdir()
+        (project_dir / "pyproject.toml").write_text("[project]\nname = 'test'")
+
+        result = runner.invoke(app, ["audit", str(project_dir), "--quiet"])
+
+        assert result.exit_code == 0
+        assert "score: " in result.stdout
+        assert "recommendations: " in result.stdout
+        assert "Detected Tooling" not in result.stdout
+        assert "Health Score" not in result.stdout
+
+    def test_audit_many_recommendations(
+        self, runner: CliRunner, temp_dir: Path
+    ) -> None:
+        """Large audits are printed as plain lines instead of a table."""
+        from quickforge.auditor import (
+            AuditCategory,
+            AuditResult,
+            Recommendation,
+            Severity,
+        )
+
+        recs = [
+            Recommendation(AuditCategory.CODE_QUALITY, f"finding {i}", Severity.INFO)
+            for i in range(60)
+        ]
+        recs.append(
+            Recommendation(
+                AuditCategory.SECURITY, "urgent", Severity.CRITICAL, action="fix it"
+            )
+        )
+        fake = AuditResult(project_path=temp_dir, recommendations=recs, score=10)
+
+        with patch("quickforge.auditor.audit_project", return_value=fake):
+            result = runner.invoke(app, ["audit", str(temp_dir)])
+
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        first = next(i for i, line in enumerate(lines) if "finding" in line)
+        assert "urgent" in lines[first - 1]
+        assert "(fix it)" in lines[first - 1]
+        assert "code quality" in lines[first]
+        assert "┃" not in result.stdout.split("Recommendations")[1]
+
     def test_upgrade_no_migrations(self, runner: CliRunner, temp_dir: Path) -> None:
         """Test upgrade command when no migrations needed."""
         # Create a modern project that doesn't need migration
@@ -433,6 +541,24 @@ typeCheckingMode = "standard"
         assert result.exit_code == 0
         assert "No migrations needed" in result.stdout or "All Good" in result.stdout
 
+    def test_upgrade_declined(self, runner: CliRunner, temp_dir: Path) -> None:
+        """Declining the confirmation leaves the project untouched."""
+        project_dir = temp_dir / "project"
+        project_dir.mkdir()
+        original = "[tool.black]\nline-length = 100\n"
+        (project_dir / "pyproject.toml").write_text(original)
+
+        result = runner.invoke(
+            app,
+            ["upgrade", str(project_dir)],
+            input="n\n",
+            env={"QUICKFORGE_SIMPLE_PROMPTS": "1"},
+        )
+
+        assert result.exit_code == 1
+        assert "Proceed with migration?" in result.stdout
+        assert (project_dir / "pyproject.toml").read_text() == original
+
     def test_add_requires_pyproject(self, runner: CliRunner, temp_dir: Path) -> None:
         """Test add command requires pyproject.toml."""
         # Create empty directory without pyproject.toml
@@ -445,3 +571,150 @@ typeCheckingMode = "standard"
 
         assert result.exit_code == 1
         assert "pyproject.toml" in result.stdout or "Error" in result.stdout
+
+
+# =============================================================================
+# Git Identity Defaults Tests
+# =============================================================================
+
+
+class TestGitIdentityDefaults:
+    """Tests for reading author defaults from git config."""
+
+    def test_reads_name_and_email_in_one_call(self) -> None:
+        """Both keys are parsed from a single --get-regexp invocation."""
+        completed = subprocess.CompletedProcess(
+            args=[],
+            returncode=0,
+            stdout="user.name Jane Doe\nuser.email jane@example.com\n",
+        )
+        with patch("subprocess.run", return_value=completed) as run:
+            assert _git_identity_defaults() == ("Jane Doe", "jane@example.com")
+
+        run.assert_called_once()
+        assert run.call_args.args[0][:3] == ["git", "config", "--get-regexp"]
+
+    def test_missing_keys_keep_defaults(self) -> None:
+        """Unset keys fall back to the placeholder defaults."""
+        completed = subprocess.CompletedProcess(args=[], returncode=1, stdout="")
+        with patch("subprocess.run", return_value=completed):
+            assert _git_identity_defaults() == ("Your Name", "")
+
+    def test_git_not_installed(self) -> None:
+        """A missing git binary falls back to the placeholder defaults."""
+        with patch("subprocess.run", side_effect=FileNotFoundError):
+            assert _git_identity_defaults() == ("Your Name", "")
+
+
+# =============================================================================
+# Plain-Text Prompt Tests
+# =============================================================================
+
+
+def _answers(*lines: str):
+    """Build a fake ``input`` that returns ``lines`` in order."""
+    it = iter(lines)
+
+    def fake_input(prompt: str = "") -> str:
+        try:
+            return next(it)
+        except StopIteration:
+            raise EOFError from None
+
+    return fake_input
+
+
+class TestSimplePrompts:
+    """Tests for the input()-based prompt fallback."""
+
+    CHOICES = (("first", 1), ("second", 2), ("third", 3))
+
+    def test_enabled_by_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """QUICKFORGE_SIMPLE_PROMPTS=1 forces the plain prompts."""
+        monkeypatch.setenv("QUICKFORGE_SIMPLE_PROMPTS", "1")
+        assert _use_simple_prompts()
+
+    def test_select_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """An empty answer returns the default."""
+        monkeypatch.setattr("builtins.input", _answers(""))
+        assert _simple_select("Pick", self.CHOICES, 2) == 2
+
+    def test_select_retries_invalid(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Out-of-range answers are rejected until a valid one is given."""
+        monkeypatch.setattr("builtins.input", _answers("9", "abc", "3"))
+        assert _simple_select("Pick", self.CHOICES, 1) == 3
+
+    def test_select_eof_aborts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """EOF on stdin aborts like Ctrl-C in questionary."""
+        import typer
+
+        monkeypatch.setattr("builtins.input", _answers())
+        with pytest.raises(typer.Abort):
+            _simple_select("Pick", self.CHOICES, 1)
+
+    def test_checkbox(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Checkbox answers are parsed as comma-separated numbers."""
+        choices = [("a", "a", True), ("b", "b", False), ("c", "c", True)]
+
+        monkeypatch.setattr("builtins.input", _answers(""))
+        assert _simple_checkbox("Pick", choices) == ["a", "c"]
+
+        monkeypatch.setattr("builtins.input", _answers("x", "2, 3"))
+        assert _simple_checkbox("Pick", choices) == ["b", "c"]
+
+        monkeypatch.setattr("builtins.input", _answers("-"))
+        assert _simple_checkbox("Pick", choices) == []
+
+    def test_text_and_confirm(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Text falls back to the default; confirm defaults to yes."""
+        monkeypatch.setattr("builtins.input", _answers("", "custom"))
+        assert _simple_text("Name:", "default") == "default"
+        assert _simple_text("Name:", "default") == "custom"
+
+        monkeypatch.setattr("builtins.input", _answers("", "maybe", "n"))
+        assert _simple_confirm("Sure?") is True
+        assert _simple_confirm("Sure?") is False
+
+    def test_select_maps_questionary_title_back(self) -> None:
+        """The questionary path passes titles and returns the chosen value."""
+        with (
+            patch("quickforge.cli._use_simple_prompts", return_value=False),
+            patch("questionary.select") as select,
+        ):
+            select.return_value.ask.return_value = "third"
+            assert _select("Pick", self.CHOICES, 2) == 3
+
+        assert select.call_args.kwargs["choices"] == ["first", "second", "third"]
+        assert select.call_args.kwargs["default"] == "second"
+
+    def test_new_interactive(self, runner: CliRunner, temp_dir: Path) -> None:
+        """The new command can be driven entirely through plain prompts."""
+        with patch("quickforge.cli._git_identity_defaults") as identity:
+            identity.return_value = ("Jane Doe", "")
+            result = runner.invoke(
+                app,
+                ["new", "promptproj", "--output", str(temp_dir), "--no-git"],
+                input="3\n\n\n\n\n\n\n\ny\n",
+                env={"QUICKFORGE_SIMPLE_PROMPTS": "1"},
+            )
+
+        assert result.exit_code == 0, result.stdout
+        pyproject = (temp_dir / "promptproj" / "pyproject.toml").read_text()
+        assert "Jane Doe" in pyproject
+        assert "typer" in pyproject
+        assert "Project Configuration" in result.stdout
+
+    def test_new_interactive_quiet(self, runner: CliRunner, temp_dir: Path) -> None:
+        """QUICKFORGE_QUIET skips the configuration summary table."""
+        with patch("quickforge.cli._git_identity_defaults") as identity:
+            identity.return_value = ("Jane Doe", "")
+            result = runner.invoke(
+                app,
+                ["new", "quietproj", "--output", str(temp_dir), "--no-git"],
+                input="\n" * 8 + "y\n",
+                env={"QUICKFORGE_SIMPLE_PROMPTS": "1", "QUICKFORGE_QUIET": "1"},
+            )
+
+        assert result.exit_code == 0, result.stdout
+        assert "Project Configuration" not in result.stdout
+        assert (temp_dir / "quietproj" / "pyproject.toml").exists()
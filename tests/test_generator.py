@@ -16,18 +16,22 @@ Test Organization
 - TestCreateProject: End-to-end generation tests
 """
 
+import subprocess
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
+from jinja2 import UndefinedError
+from rich.console import Console
 
 from quickforge.generator import (
+    TEMPLATE_MAPPINGS,
     GenerationResult,
+    _get_template,
+    _template_flags,
     create_directory_structure,
     create_jinja_env,
     create_project,
-    create_py_typed,
-    create_test_init,
     get_output_path,
     init_git_repository,
     render_all_templates,
@@ -219,6 +223,32 @@ class TestTemplateRendering:
         assert "typer" in content.lower()
         assert "testcli" in content
 
+    def test_rendered_paths_match_get_output_path(
+        self, cli_config: ProjectConfig
+    ) -> None:
+        """Test precomputed output paths agree with get_output_path."""
+        rendered = render_all_templates(cli_config)
+        expected = {
+            get_output_path(pattern, cli_config)
+            for pattern, condition in TEMPLATE_MAPPINGS.values()
+            if condition is None or _template_flags(cli_config)[condition]
+        }
+        assert expected | {Path("LICENSE")} == set(rendered)
+
+    def test_every_condition_has_a_flag(self, basic_config: ProjectConfig) -> None:
+        """Test each TEMPLATE_MAPPINGS condition names a known flag."""
+        flags = _template_flags(basic_config)
+        conditions = {c for _, c in TEMPLATE_MAPPINGS.values() if c is not None}
+        assert conditions <= set(flags)
+
+    def test_templates_are_compiled_once(self, basic_config: ProjectConfig) -> None:
+        """Test the shared template cache returns the same compiled template."""
+        assert _get_template("README.md.j2") is _get_template("README.md.j2")
+
+        rendered = render_all_templates(basic_config)
+        fresh = render_template(create_jinja_env(), "README.md.j2", basic_config)
+        assert rendered[Path("README.md")] == fresh
+
     def test_get_output_path_with_placeholders(
         self, basic_config: ProjectConfig
     ) -> None:
@@ -261,6 +291,39 @@ class TestTemplateRendering:
         # API-specific file should be included
         assert Path("src/testapi/main.py") in rendered
 
+    def test_snake_case_filter(self) -> None:
+        """Test the snake_case filter for ASCII and non-ASCII names."""
+        snake_case = create_jinja_env().filters["snake_case"]
+        assert snake_case("My-Cool-App") == "my_cool_app"
+        assert snake_case("Ünïcode-Näme") == "ünïcode_näme"
+
+    def test_render_all_templates_skips_missing(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test templates missing from the package are skipped."""
+        available = frozenset(create_jinja_env().list_templates())
+        with patch(
+            "quickforge.generator._available_templates",
+            return_value=available - {"README.md.j2"},
+        ):
+            rendered = render_all_templates(basic_config)
+
+        assert Path("README.md") not in rendered
+        assert Path("pyproject.toml") in rendered
+
+    def test_render_all_templates_propagates_errors(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test a failing template is reported instead of silently dropped."""
+        with (
+            patch(
+                "quickforge.generator._template_context",
+                side_effect=lambda config: {},
+            ),
+            pytest.raises(UndefinedError),
+        ):
+            render_all_templates(basic_config)
+
 
 # =============================================================================
 # File Writing Tests
@@ -288,26 +351,35 @@ class TestFileWriting:
             basic_config.project_dir / "subdir/nested.txt"
         ).read_text() == "Nested content"
 
-    def test_create_py_typed(self, basic_config: ProjectConfig) -> None:
-        """Test py.typed marker file creation."""
-        # Create directories first
-        create_directory_structure(basic_config)
-
-        create_py_typed(basic_config)
+    def test_write_files_shared_and_nested_parents(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test files sharing or nesting parent directories are all written."""
+        basic_config.project_dir.mkdir(parents=True)
+        files = {
+            Path("src/pkg/a.py"): "a",
+            Path("src/pkg/b.py"): "b",
+            Path("src/pkg/sub/c.py"): "c",
+            Path("top.txt"): "top",
+        }
 
-        py_typed = basic_config.project_dir / basic_config.get_src_path() / "py.typed"
-        assert py_typed.exists()
+        created = write_files(basic_config.project_dir, files)
 
-    def test_create_test_init(self, basic_config: ProjectConfig) -> None:
-        """Test tests/__init__.py creation."""
-        # Create directories first
-        create_directory_structure(basic_config)
+        project_dir = basic_config.project_dir
+        assert created == [project_dir / path for path in files]
+        assert (project_dir / "src/pkg/sub/c.py").read_text() == "c"
 
-        create_test_init(basic_config)
+    def test_write_files_utf8_with_lf_endings(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test content is written as UTF-8 without newline translation."""
+        basic_config.project_dir.mkdir(parents=True)
+        write_files(
+            basic_config.project_dir, {Path("README.md"): "# Caf\u00e9\n\nok\n"}
+        )
 
-        test_init = basic_config.project_dir / "tests" / "__init__.py"
-        assert test_init.exists()
-        assert "testproject" in test_init.read_text()
+        data = (basic_config.project_dir / "README.md").read_bytes()
+        assert data == "# Caf\u00e9\n\nok\n".encode()
 
 
 # =============================================================================
@@ -342,6 +414,24 @@ class TestGitInitialization:
 
         assert result is False
 
+    def test_init_git_runs_no_probe(self, tmp_path: Path) -> None:
+        """Test git is started only for real work, with output discarded."""
+        with patch("quickforge.generator.subprocess.run") as mock_run:
+            mock_run.return_value.stdout = "value"
+            assert init_git_repository(tmp_path) is True
+
+        commands = [call.args[0][:2] for call in mock_run.call_args_list]
+        assert commands == [
+            ["git", "init"],
+            ["git", "add"],
+            ["git", "config"],
+            ["git", "config"],
+            ["git", "commit"],
+        ]
+        init_kwargs = mock_run.call_args_list[0].kwargs
+        assert init_kwargs["stdout"] is subprocess.DEVNULL
+        assert init_kwargs["stdin"] is subprocess.DEVNULL
+
 
 # =============================================================================
 # Project Validation Tests
@@ -353,12 +443,7 @@ class TestProjectValidation:
 
     def test_validate_complete_project(self, basic_config: ProjectConfig) -> None:
         """Test validation of a complete project."""
-        # Create complete project structure
-        create_directory_structure(basic_config)
-        rendered = render_all_templates(basic_config)
-        write_files(basic_config.project_dir, rendered)
-        create_py_typed(basic_config)
-        create_test_init(basic_config)
+        create_project(basic_config, verbose=False, init_git=False)
 
         success, issues = validate_project(basic_config)
 
@@ -376,6 +461,32 @@ class TestProjectValidation:
         assert success is False
         assert len(issues) > 0
 
+    def test_validate_reports_each_missing_file(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test only the files that are actually missing are reported."""
+        create_project(basic_config, verbose=False, init_git=False)
+        (basic_config.project_dir / "README.md").unlink()
+        (basic_config.project_dir / basic_config.get_src_path() / "py.typed").unlink()
+
+        success, issues = validate_project(basic_config)
+
+        assert success is False
+        assert issues == [
+            "Missing essential file: README.md",
+            f"Missing essential file: {basic_config.get_src_path() / 'py.typed'}",
+        ]
+
+    def test_validate_invalid_pyproject(self, basic_config: ProjectConfig) -> None:
+        """Test validation reports a pyproject.toml that is not valid TOML."""
+        create_project(basic_config, verbose=False, init_git=False)
+        (basic_config.project_dir / "pyproject.toml").write_text("[project\n")
+
+        success, issues = validate_project(basic_config)
+
+        assert success is False
+        assert any(issue.startswith("Invalid pyproject.toml") for issue in issues)
+
     def test_validate_invalid_python_syntax(self, basic_config: ProjectConfig) -> None:
         """Test validation catches Python syntax errors."""
         create_directory_structure(basic_config)
@@ -389,6 +500,19 @@ class TestProjectValidation:
         assert success is False
         assert any("Syntax error" in issue for issue in issues)
 
+    def test_validate_syntax_honours_coding(self, basic_config: ProjectConfig) -> None:
+        """Test only real syntax errors are reported, not declared encodings."""
+        create_directory_structure(basic_config)
+        src_dir = basic_config.project_dir / basic_config.get_src_path()
+        (src_dir / "latin.py").write_bytes(b"# -*- coding: latin-1 -*-\nx = '\xe9'\n")
+        (src_dir / "bad.py").write_text("def broken(\n")
+
+        _, issues = validate_project(basic_config)
+
+        syntax_errors = [issue for issue in issues if "Syntax error" in issue]
+        assert len(syntax_errors) == 1
+        assert "bad.py" in syntax_errors[0]
+
 
 # =============================================================================
 # End-to-End Generation Tests
@@ -411,6 +535,71 @@ class TestCreateProject:
         assert (basic_config.project_dir / "README.md").exists()
         assert (basic_config.project_dir / ".gitignore").exists()
 
+    def test_create_writes_marker_files(self, basic_config: ProjectConfig) -> None:
+        """Test py.typed and tests/__init__.py are written with the templates."""
+        result = create_project(basic_config, verbose=False, init_git=False)
+
+        project_dir = basic_config.project_dir
+        py_typed = project_dir / basic_config.get_src_path() / "py.typed"
+        test_init = project_dir / "tests" / "__init__.py"
+        assert py_typed.read_bytes() == b""
+        assert basic_config.name in test_init.read_text()
+        assert py_typed in result.files_created
+        assert test_init in result.files_created
+
+    def test_verbose_output(self, basic_config: ProjectConfig) -> None:
+        """Test verbose status output lists each step and created path."""
+        recorder = Console(record=True, width=100)
+        with (
+            patch("quickforge.generator.console", recorder),
+            patch(
+                "quickforge.generator.validate_project",
+                return_value=(False, ["issue one", "issue two"]),
+            ),
+        ):
+            create_project(basic_config, verbose=True, init_git=False)
+
+        lines = recorder.export_text().splitlines()
+        assert "📁 Creating directory structure..." in lines
+        assert "  Created testproject/tests/" in lines
+        assert "  Created src/testproject/py.typed" in lines
+        assert "  ⚠ issue one" in lines
+        assert "  ⚠ issue two" in lines
+        # Each step heading is preceded by a blank line
+        rendering = lines.index("📝 Rendering templates...")
+        assert lines[rendering - 1] == ""
+
+    def test_failed_create_removes_partial_project(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test a failure removes the partial directory and keeps the error."""
+        with (
+            patch(
+                "quickforge.generator.render_all_templates",
+                side_effect=RuntimeError("boom"),
+            ),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            create_project(basic_config, verbose=False, init_git=False)
+
+        assert not basic_config.project_dir.exists()
+
+    def test_failed_cleanup_keeps_original_error(
+        self, basic_config: ProjectConfig
+    ) -> None:
+        """Test an incomplete cleanup does not mask the generation error."""
+        with (
+            patch(
+                "quickforge.generator.render_all_templates",
+                side_effect=RuntimeError("boom"),
+            ),
+            patch("quickforge.generator.shutil.rmtree"),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            create_project(basic_config, verbose=True, init_git=False)
+
+        assert basic_config.project_dir.exists()
+
     def test_create_cli_project(self, cli_config: ProjectConfig) -> None:
         """Test creating a CLI project."""
         result = create_project(cli_config, verbose=False, init_git=False)
@@ -539,3 +728,8 @@ class TestGenerationResult:
         )
 
         assert len(result.files_created) == 2
+
+    def test_is_slotted(self) -> None:
+        """Test GenerationResult instances carry no per-instance __dict__."""
+        result = GenerationResult(success=True, project_path=Path("/test"))
+        assert not hasattr(result, "__dict__")
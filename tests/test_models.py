@@ -21,6 +21,7 @@ from pathlib import Path
 
 import pytest
 
+from quickforge.generator import create_jinja_env, render_template
 from quickforge.models import (
     AuthorInfo,
     FeaturesConfig,
@@ -148,6 +149,12 @@ class TestToolingConfig:
         config = ToolingConfig(type_checker="mypy")
         assert config.type_checker == "mypy"
 
+    def test_is_frozen(self) -> None:
+        """Tooling config cannot be changed after construction."""
+        config = ToolingConfig()
+        with pytest.raises(ValueError):
+            config.linter = "flake8"  # type: ignore[misc]
+
     def test_strict_mode(self) -> None:
         """Test strict type checking mode."""
         config = ToolingConfig(type_checking_mode=TypeCheckingMode.STRICT)
@@ -196,7 +203,15 @@ class TestFeaturesConfig:
             docs=False,
             devcontainer=False,
         )
-        assert config.enabled_features == []
+        assert config.enabled_features == ()
+
+    def test_features_config_is_frozen(self) -> None:
+        """FeaturesConfig is immutable, so enabled_features stays valid."""
+        config = FeaturesConfig(docker=False)
+        assert "docker" not in config.enabled_features
+
+        with pytest.raises(ValueError):
+            config.docker = True  # type: ignore[misc]
 
 
 # =============================================================================
@@ -274,6 +289,8 @@ class TestProjectConfig:
             "my project",  # Contains space
             "my.project",  # Contains dot
             "@myproject",  # Starts with special char
+            "caf\u00e9",  # Non-ASCII letter
+            "   ",  # Empty after stripping
         ]
         for name in invalid_names:
             with pytest.raises(ValueError):
@@ -299,6 +316,26 @@ class TestProjectConfig:
         )
         assert config.project_dir == Path("/home/user/myproject")
 
+    def test_computed_paths_are_cached(self) -> None:
+        """Test package_name and project_dir are computed once per config."""
+        config = ProjectConfig(name="my-project", output_dir=Path("/tmp"))
+        assert config.package_name is config.package_name
+        assert config.project_dir is config.project_dir
+        assert config.get_src_path() is config.src_path
+        assert "package_name" not in config.model_dump()
+
+    def test_is_frozen(self) -> None:
+        """Project config cannot be changed after construction."""
+        config = ProjectConfig(name="myproject")
+        with pytest.raises(ValueError):
+            config.name = "other"  # type: ignore[misc]
+
+    def test_sub_models_are_not_copied(self) -> None:
+        """Test validated sub-model instances are reused as-is."""
+        features = FeaturesConfig(docker=True)
+        config = ProjectConfig(name="myproject", features=features)
+        assert config.features is features
+
     def test_src_path_for_library(self) -> None:
         """Test get_src_path for library projects."""
         config = ProjectConfig(
@@ -375,6 +412,35 @@ class TestProjectConfig:
         assert data["name"] == "myproject"
         assert isinstance(data["output_dir"], str)
 
+    def test_from_toml_trusted_round_trip(self, tmp_path: Path) -> None:
+        """Test trusted loading rebuilds enums, sub-models and paths."""
+        import tomli_w
+
+        config = ProjectConfig(
+            name="full-project",
+            project_type=ProjectType.CLI,
+            license=License.APACHE2,
+            author=AuthorInfo(name="Dev", email="dev@example.com"),
+            tooling=ToolingConfig(type_checking_mode=TypeCheckingMode.STRICT),
+            features=FeaturesConfig(docker=True),
+            output_dir=tmp_path,
+        )
+        toml_path = tmp_path / "quickforge.toml"
+        toml_path.write_bytes(tomli_w.dumps(config.to_toml_dict()).encode())
+
+        loaded = ProjectConfig.from_toml(toml_path, trusted=True)
+
+        assert loaded == config
+        assert loaded.project_type is ProjectType.CLI
+        assert isinstance(loaded.author, AuthorInfo)
+        assert isinstance(loaded.tooling.type_checking_mode, TypeCheckingMode)
+        assert loaded.tooling.type_checking_mode is TypeCheckingMode.STRICT
+        assert loaded.features.enabled_features == config.features.enabled_features
+        assert loaded.output_dir == tmp_path
+
+        content = render_template(create_jinja_env(), "pyproject.toml.j2", loaded)
+        assert 'typeCheckingMode = "strict"' in content
+
 
 # =============================================================================
 # Integration Tests
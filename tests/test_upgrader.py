@@ -1,12 +1,15 @@
 """Tests for quickforge.upgrader module."""
 
 from pathlib import Path
+from unittest.mock import patch
 
 from quickforge.upgrader import (
     MigrationStep,
     MigrationType,
     SourceTool,
     UpgradeResult,
+    _ensure_pyproject_exists,
+    _read_toml_doc,
     create_backup,
     create_migration_plan,
     detect_source_tool,
@@ -71,6 +74,61 @@ class TestCreateBackup:
 
         assert (backup_path / "pyproject.toml").read_text() == original_content
 
+    def test_backs_up_only_present_config_files(self, tmp_path: Path) -> None:
+        """Test unrelated files and missing candidates are left out."""
+        (tmp_path / ".flake8").write_text("[flake8]\n")
+        (tmp_path / "notes.txt").write_text("not config")
+        (tmp_path / "Pipfile").mkdir()  # Not a file: skipped
+
+        backup_path = create_backup(tmp_path)
+
+        assert sorted(p.name for p in backup_path.iterdir()) == [".flake8"]
+
+    def test_lock_files_are_linked_config_files_copied(self, tmp_path: Path) -> None:
+        """Test lock files share the original inode; edited files do not."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'")
+        (tmp_path / "poetry.lock").write_text("# lock")
+
+        backup_path = create_backup(tmp_path)
+
+        assert (backup_path / "poetry.lock").samefile(tmp_path / "poetry.lock")
+        assert not (backup_path / "pyproject.toml").samefile(
+            tmp_path / "pyproject.toml"
+        )
+
+        # Rewriting pyproject.toml in place must not reach the backup
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'changed'")
+        assert "test" in (backup_path / "pyproject.toml").read_text()
+
+    def test_falls_back_to_copy_without_hard_links(self, tmp_path: Path) -> None:
+        """Test lock files are copied where hard links are not supported."""
+        (tmp_path / "poetry.lock").write_text("# lock")
+
+        with patch.object(Path, "hardlink_to", side_effect=OSError("no links")):
+            backup_path = create_backup(tmp_path)
+
+        assert (backup_path / "poetry.lock").read_text() == "# lock"
+        assert not (backup_path / "poetry.lock").samefile(tmp_path / "poetry.lock")
+
+
+class TestEnsurePyprojectExists:
+    """Tests for loading or creating the pyproject.toml document."""
+
+    def test_reads_existing_file(self, tmp_path: Path) -> None:
+        """Test an existing pyproject.toml is returned as parsed."""
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'existing'\n")
+        doc = _ensure_pyproject_exists(tmp_path)
+        assert doc["project"]["name"] == "existing"
+
+    def test_creates_minimal_document(self, tmp_path: Path) -> None:
+        """Test a missing or unparsable file yields a minimal document."""
+        doc = _ensure_pyproject_exists(tmp_path)
+        assert doc["project"]["name"] == tmp_path.name
+        assert doc["build-system"]["build-backend"] == "hatchling.build"
+
+        (tmp_path / "pyproject.toml").write_text("[project\n")
+        assert _ensure_pyproject_exists(tmp_path)["project"]["version"] == "0.1.0"
+
 
 class TestCreateMigrationPlan:
     """Tests for create_migration_plan function."""
@@ -231,6 +289,22 @@ version = "0.1.0"
         # poetry.lock should still exist
         assert (tmp_path / "poetry.lock").exists()
 
+    def test_dry_run_does_not_reparse_pyproject(self, tmp_path: Path) -> None:
+        """Test a dry run keeps its document after package manager steps."""
+        (tmp_path / "requirements.txt").write_text("requests>=2.0\n")
+        (tmp_path / "pyproject.toml").write_text("[project]\nname = 'test'\n")
+
+        counts = []
+        for dry_run in (True, False):
+            with patch(
+                "quickforge.upgrader._read_toml_doc", wraps=_read_toml_doc
+            ) as read_doc:
+                upgrade_project(tmp_path, dry_run=dry_run, backup=False)
+            counts.append(read_doc.call_count)
+
+        # Only the real run re-reads the rewritten pyproject.toml
+        assert counts[1] == counts[0] + 1
+
     def test_upgrade_black_to_ruff(self, tmp_path: Path) -> None:
         """Test migrating Black config to ruff."""
         pyproject = tmp_path / "pyproject.toml"
@@ -250,6 +324,33 @@ target-version = ["py311"]
         assert "[tool.ruff]" in content
         assert "[tool.black]" not in content
 
+    def test_upgrade_uses_given_plan(self, tmp_path: Path) -> None:
+        """A plan passed in by the caller is executed as-is."""
+        pyproject = tmp_path / "pyproject.toml"
+        pyproject.write_text("""
+[project]
+name = "test"
+
+[tool.black]
+line-length = 100
+
+[tool.mypy]
+strict = true
+""")
+        steps = [
+            step
+            for step in create_migration_plan(tmp_path)
+            if step.migration_type == MigrationType.FORMATTER
+        ]
+
+        result = upgrade_project(tmp_path, backup=False, steps=steps)
+
+        assert result.success
+        assert result.migration_steps == steps
+        content = pyproject.read_text()
+        assert "[tool.black]" not in content
+        assert "[tool.mypy]" in content
+
     def test_upgrade_mypy_to_basedpyright(self, tmp_path: Path) -> None:
         """Test migrating mypy to basedpyright."""
         pyproject = tmp_path / "pyproject.toml"
@@ -452,6 +553,11 @@ class TestMigrationStep:
         assert step.target == "uv"
         assert step.reversible is True
 
+    def test_display_label(self) -> None:
+        """Migration types have a space-separated display label."""
+        assert MigrationType.PACKAGE_MANAGER.display_label == "package manager"
+        assert MigrationType.LINTER.display_label == "linter"
+
 
 class TestUpgradeResult:
     """Tests for UpgradeResult dataclass."""